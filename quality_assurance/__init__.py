@@ -22,6 +22,7 @@ from .schema_validator import (
     check_schema_completeness
 )
 from .anomaly_detector import (
+    MatchColumns,
     detect_statistical_anomalies,
     identify_performance_outliers,
     analyze_data_patterns,
@@ -60,6 +61,7 @@ __all__ = [
     'validate_schema_structure',
     'validate_jsonld_compliance',
     'check_schema_completeness',
+    'MatchColumns',
     'detect_statistical_anomalies',
     'identify_performance_outliers',
     'analyze_data_patterns',
@@ -6,7 +6,8 @@ Statistical analysis and outlier detection algorithms for TFT data.
 
 import numpy as np
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Union
+from dataclasses import dataclass
 from datetime import datetime
 from collections import defaultdict
 
@@ -22,7 +23,94 @@ def _get_grade(score: float) -> str:
     return "F"
 
 
-def detect_statistical_anomalies(match_data: Dict[str, Any], threshold_std: float = 3.0) -> Dict[str, Any]:
+def _summarize(values: np.ndarray) -> Dict[str, Any]:
+    """Mean/std/min/max/count of a numeric column as plain Python numbers."""
+    return {
+        "mean": float(values.mean()),
+        "std": float(values.std()),
+        "min": values.min().item(),
+        "max": values.max().item(),
+        "count": int(values.size)
+    }
+
+
+def _narrow(values: List[Any], dtype: type) -> np.ndarray:
+    """
+    Array of values stored as dtype when they are integers that all fit in it.
+    
+    Anything else (floats, out-of-range or non-numeric values) keeps NumPy's
+    default dtype, so the range checks still see the original values.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind in "iu" and values.size:
+        info = np.iinfo(dtype)
+        if info.min <= values.min() and values.max() <= info.max:
+            return values.astype(dtype)
+    return values
+
+
+def _count_severities(anomalies: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Number of anomalies per severity level (missing severity counts as low)."""
+    counts = defaultdict(int)
+    for anomaly in anomalies:
+        counts[anomaly.get("severity", "low")] += 1
+    return dict(counts)
+
+
+@dataclass
+class MatchColumns:
+    """
+    Column-per-field view of a matches dict, built once and shared by the
+    numeric checks instead of re-walking the nested match dicts.
+    
+    Per-match columns are aligned with match_ids; per-participant columns
+    are flattened across all matches. Placements and levels are stored as
+    int8 and damage as int16 whenever the values fit.
+    """
+    match_ids: np.ndarray
+    game_lengths: np.ndarray
+    placements: np.ndarray
+    levels: np.ndarray
+    damage: np.ndarray
+    match_count: int
+    
+    @classmethod
+    def from_matches(cls, match_data: Dict[str, Any]) -> "MatchColumns":
+        """
+        Build columns from a matches dict (match_id -> Riot match payload).
+        
+        Missing fields take the same defaults the anomaly checks always used.
+        """
+        match_ids = []
+        game_lengths = []
+        placements = []
+        levels = []
+        damage_values = []
+        
+        for match_id, match_info in match_data.items():
+            if "info" in match_info:
+                info = match_info["info"]
+                match_ids.append(match_id)
+                game_lengths.append(info.get("game_length", 0))
+                
+                if "participants" in info:
+                    for participant in info["participants"]:
+                        get = participant.get
+                        placements.append(get("placement", 8))
+                        levels.append(get("level", 1))
+                        damage_values.append(get("total_damage_to_players", 0))
+        
+        return cls(
+            match_ids=np.asarray(match_ids, dtype=object),
+            game_lengths=np.asarray(game_lengths),
+            placements=_narrow(placements, np.int8),
+            levels=_narrow(levels, np.int8),
+            damage=_narrow(damage_values, np.int16),
+            match_count=len(match_data)
+        )
+
+
+def detect_statistical_anomalies(match_data: Union[Dict[str, Any], MatchColumns], threshold_std: float = 3.0) -> Dict[str, Any]:
     """
     Detect data quality anomalies in match data.
     
@@ -30,11 +118,13 @@ def detect_statistical_anomalies(match_data: Dict[str, Any], threshold_std: floa
     Statistical outliers are reported in summary but not as anomalies.
     
     Args:
-        match_data: Dictionary containing match information
+        match_data: Dictionary containing match information, or MatchColumns
+            already built from it
         threshold_std: Standard deviation threshold for outlier detection
         
     Returns:
-        dict: Anomaly detection report
+        dict: Anomaly detection report; severity_counts tallies
+        anomalies_detected by severity
     """
     report = {
         "timestamp": datetime.now().isoformat(),
@@ -43,52 +133,28 @@ def detect_statistical_anomalies(match_data: Dict[str, Any], threshold_std: floa
         "outlier_summary": {},
         "threshold_used": threshold_std,
         "anomaly_count": 0,
+        "severity_counts": {},
         "data_quality_flags": []
     }
     
     try:
-        # Extract match metrics for analysis
-        placements = []
-        game_lengths = []
-        levels = []
-        damage_values = []
+        # The checks below run on whole NumPy columns instead of
+        # per-participant Python comparisons
+        columns = match_data if isinstance(match_data, MatchColumns) else MatchColumns.from_matches(match_data)
         
-        # Track impossible values (actual anomalies)
-        invalid_placements = 0
-        invalid_levels = 0
-        negative_damage = 0
-        impossible_game_lengths = 0
+        # Game length analysis (in minutes); zero/missing lengths are skipped
+        game_lengths = columns.game_lengths / 60
+        game_lengths = game_lengths[game_lengths > 0]
+        placements = columns.placements
+        levels = columns.levels
+        damage_values = columns.damage
         
-        for match_id, match_info in match_data.items():
-            if "info" in match_info:
-                info = match_info["info"]
-                
-                # Game length analysis (in minutes)
-                game_length = info.get("game_length", 0) / 60
-                if game_length > 0:
-                    game_lengths.append(game_length)
-                    # Flag impossible game lengths (< 5 min or > 60 min)
-                    if game_length < 5 or game_length > 60:
-                        impossible_game_lengths += 1
-                
-                # Participant analysis
-                if "participants" in info:
-                    for participant in info["participants"]:
-                        placement = participant.get("placement", 8)
-                        level = participant.get("level", 1)
-                        damage = participant.get("total_damage_to_players", 0)
-                        
-                        placements.append(placement)
-                        levels.append(level)
-                        damage_values.append(damage)
-                        
-                        # Flag impossible values
-                        if placement < 1 or placement > 8:
-                            invalid_placements += 1
-                        if level < 1 or level > 10:
-                            invalid_levels += 1
-                        if damage < 0:
-                            negative_damage += 1
+        # Track impossible values (actual anomalies)
+        invalid_placements = int(np.count_nonzero((placements < 1) | (placements > 8)))
+        invalid_levels = int(np.count_nonzero((levels < 1) | (levels > 10)))
+        negative_damage = int(np.count_nonzero(damage_values < 0))
+        # Flag impossible game lengths (< 5 min or > 60 min)
+        impossible_game_lengths = int(np.count_nonzero((game_lengths < 5) | (game_lengths > 60)))
         
         # Record impossible value anomalies (aggregated)
         if invalid_placements > 0:
@@ -124,63 +190,36 @@ def detect_statistical_anomalies(match_data: Dict[str, Any], threshold_std: floa
             })
         
         # Calculate statistical summaries (informational, not anomalies)
-        if placements:
-            report["statistical_summary"]["placements"] = {
-                "mean": float(np.mean(placements)),
-                "std": float(np.std(placements)),
-                "min": min(placements),
-                "max": max(placements),
-                "count": len(placements)
-            }
+        if placements.size:
+            report["statistical_summary"]["placements"] = _summarize(placements)
         
-        if game_lengths:
-            report["statistical_summary"]["game_lengths"] = {
-                "mean": float(np.mean(game_lengths)),
-                "std": float(np.std(game_lengths)),
-                "min": min(game_lengths),
-                "max": max(game_lengths),
-                "count": len(game_lengths)
-            }
+        if game_lengths.size:
+            report["statistical_summary"]["game_lengths"] = _summarize(game_lengths)
         
-        if levels:
-            report["statistical_summary"]["levels"] = {
-                "mean": float(np.mean(levels)),
-                "std": float(np.std(levels)),
-                "min": min(levels),
-                "max": max(levels),
-                "count": len(levels)
-            }
+        if levels.size:
+            report["statistical_summary"]["levels"] = _summarize(levels)
         
-        if damage_values:
-            damage_mean = np.mean(damage_values)
-            damage_std = np.std(damage_values)
-            report["statistical_summary"]["damage"] = {
-                "mean": float(damage_mean),
-                "std": float(damage_std),
-                "min": min(damage_values),
-                "max": max(damage_values),
-                "count": len(damage_values)
-            }
+        if damage_values.size:
+            damage_summary = _summarize(damage_values)
+            report["statistical_summary"]["damage"] = damage_summary
             
             # Count statistical outliers (informational only)
-            high_damage_outliers = sum(1 for d in damage_values 
-                                       if d > damage_mean + threshold_std * damage_std)
-            report["outlier_summary"]["high_damage_outliers"] = high_damage_outliers
+            damage_cutoff = damage_summary["mean"] + threshold_std * damage_summary["std"]
+            report["outlier_summary"]["high_damage_outliers"] = int(np.count_nonzero(damage_values > damage_cutoff))
         
-        if game_lengths:
-            length_mean = np.mean(game_lengths)
-            length_std = np.std(game_lengths)
-            length_outliers = sum(1 for g in game_lengths 
-                                  if abs(g - length_mean) > threshold_std * length_std)
-            report["outlier_summary"]["game_length_outliers"] = length_outliers
+        if game_lengths.size:
+            length_summary = report["statistical_summary"]["game_lengths"]
+            length_outliers = np.abs(game_lengths - length_summary["mean"]) > threshold_std * length_summary["std"]
+            report["outlier_summary"]["game_length_outliers"] = int(np.count_nonzero(length_outliers))
         
         report["anomaly_count"] = len(report["anomalies_detected"])
+        report["severity_counts"] = _count_severities(report["anomalies_detected"])
         
         # Data quality flags
-        if len(game_lengths) < len(match_data) * 0.8:
+        if game_lengths.size < columns.match_count * 0.8:
             report["data_quality_flags"].append("Missing game length data in >20% of matches")
         
-        if len(placements) < len(match_data) * 8 * 0.8:
+        if placements.size < columns.match_count * 8 * 0.8:
             report["data_quality_flags"].append("Missing participant data detected")
         
         logger.info(f"Statistical anomaly detection complete. Found {report['anomaly_count']} data quality issues")
@@ -193,6 +232,7 @@ def detect_statistical_anomalies(match_data: Dict[str, Any], threshold_std: floa
             "value": str(e),
             "severity": "critical"
         })
+        report["severity_counts"] = _count_severities(report["anomalies_detected"])
         logger.error(f"Statistical anomaly detection failed: {e}")
         return report
 
@@ -483,9 +523,8 @@ def generate_anomaly_report(data: Dict[str, Any], include_details: bool = True)
                 report["detailed_findings"]["statistical_anomalies"] = stat_report
                 
                 # Count anomalies by severity
-                for anomaly in stat_report["anomalies_detected"]:
-                    severity = anomaly.get("severity", "low")
-                    report["anomaly_summary"][severity] += 1
+                for severity, count in stat_report["severity_counts"].items():
+                    report["anomaly_summary"][severity] += count
             
             # Performance outliers
             if "players" in data:
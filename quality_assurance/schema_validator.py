@@ -10,6 +10,12 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# JSON-LD compliance rules, built once at import rather than on every call
+_JSONLD_NAMESPACES = ("tft", "dcterms", "rdf", "rdfs")
+_PLAYER_TYPE = "TFTPlayer"
+_MATCH_TYPE = "TFTMatch"
+
+
 def validate_schema_structure(schema_generator) -> bool:
     """
     Validate that the schema has all required components
@@ -72,18 +78,26 @@ def validate_jsonld_compliance(data: Dict[str, Any]) -> Tuple[bool, List[str]]:
         # Check namespace usage
         if "@context" in data:
             context = data["@context"]
-            required_namespaces = ["tft", "dcterms", "rdf", "rdfs"]
             
-            for ns in required_namespaces:
+            for ns in _JSONLD_NAMESPACES:
                 if ns not in context:
                     issues.append(f"Missing namespace: {ns}")
         
-        # Check semantic relationships and types
+        # Check semantic relationships and types. A single combined test
+        # screens out compliant records and only the rest get itemised; on
+        # malformed (non-dict) records every record is itemised as before.
         if "players" in data:
-            for puuid, player_data in data["players"].items():
+            try:
+                flagged = [
+                    (puuid, player_data) for puuid, player_data in data["players"].items()
+                    if player_data.get("@type") != _PLAYER_TYPE or "@id" not in player_data
+                ]
+            except (AttributeError, TypeError):
+                flagged = data["players"].items()
+            for puuid, player_data in flagged:
                 if "@type" not in player_data:
                     issues.append(f"Player {puuid} missing @type field")
-                elif player_data["@type"] != "TFTPlayer":
+                elif player_data["@type"] != _PLAYER_TYPE:
                     issues.append(f"Player {puuid} has incorrect @type: {player_data['@type']} (expected TFTPlayer)")
                 
                 if "@id" not in player_data:
@@ -91,10 +105,17 @@ def validate_jsonld_compliance(data: Dict[str, Any]) -> Tuple[bool, List[str]]:
         
         # Check match semantic structure
         if "matches" in data:
-            for match_id, match_data in data["matches"].items():
+            try:
+                flagged = [
+                    (match_id, match_data) for match_id, match_data in data["matches"].items()
+                    if match_data.get("@type") != _MATCH_TYPE
+                ]
+            except (AttributeError, TypeError):
+                flagged = data["matches"].items()
+            for match_id, match_data in flagged:
                 if "@type" not in match_data:
                     issues.append(f"Match {match_id} missing @type field")
-                elif match_data["@type"] != "TFTMatch":
+                elif match_data["@type"] != _MATCH_TYPE:
                     issues.append(f"Match {match_id} has incorrect @type: {match_data['@type']} (expected TFTMatch)")
         
         return len(issues) == 0, issues
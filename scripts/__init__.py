@@ -33,6 +33,7 @@ from .utils import (
     save_data_to_file,
     load_data_from_file,
     identify_incomplete_matches,
+    IncompleteMatch,
     SPECIAL_QUEUES,
 )
 
@@ -61,5 +62,6 @@ __all__ = [
     'save_data_to_file',
     'load_data_from_file',
     'identify_incomplete_matches',
+    'IncompleteMatch',
     'SPECIAL_QUEUES',
 ]
@@ -21,6 +21,10 @@ try:
     import duckdb
 except ImportError:
     raise ImportError("DuckDB is required. Install it with: pip install duckdb")
+try:
+    import uuid_utils
+except ImportError:  # optional Rust-backed UUIDv7; stdlib uuid is the fallback
+    uuid_utils = None
 from datetime import datetime
 from typing import Dict, Any, Optional, Union, List
 from dataclasses import dataclass, asdict
@@ -270,11 +274,14 @@ class TFTIdentifierSystem:
         - Collision resistance
         - No central authority required
         
-        Note: Falls back to UUID4 if UUIDv7 is not available
+        Uses uuid_utils when installed, then the stdlib uuid.uuid7
+        (Python 3.14+), and falls back to UUID4 if neither is available
         
         Returns:
             UUID string in URN format
         """
+        if uuid_utils is not None:
+            return f"urn:uuid:{uuid_utils.uuid7()}"
         try:
             uuid_obj = uuid.uuid7()
         except AttributeError:
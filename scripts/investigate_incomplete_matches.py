@@ -394,7 +394,7 @@ Examples:
     
     # Save detailed report if requested
     if args.output:
-        saved_path = save_data_to_file(analysis, args.output, create_dirs=True)
+        saved_path = save_data_to_file(analysis, args.output, create_dirs=True, pretty=True)
         if saved_path:
             print(f"\n[INFO] Detailed report saved to: {saved_path}")
         else:
@@ -5,10 +5,12 @@ It fetches each unique match only once.
 """
 
 import logging
-from typing import Dict, List, Set, Any, Optional
-from collections import defaultdict
+from typing import Dict, List, Set, Any, Optional, Callable, Iterable, Iterator, Tuple
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+import sqlite3
+import threading
 import time
-import json
 from datetime import datetime, timedelta
 
 # Import base classes - handle both direct execution and module import
@@ -21,12 +23,71 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from scripts.base_infrastructure import BaseAPIInfrastructure
 from scripts.riot_api_endpoints import RiotAPIEndpoints
 from scripts.leaderboard_mixin import LeaderboardMixin
-from scripts.utils import save_data_to_file
+from scripts.utils import save_data_to_file, save_data_stream, dumps_json, loads_json
 from scripts.schema import get_tft_context
 from scripts.identifier_system import TFTIdentifierSystem
 
 logger = logging.getLogger(__name__)
 
+
+class PersistentMatchCache:
+    """
+    On-disk store of raw match-detail responses keyed by (region, match_id).
+    
+    Backed by SQLite so repeated runs (e.g. pipeline tests) can skip matches
+    they have already downloaded. Finished matches never change, so entries
+    have no expiry. Safe to share between the collector's fetch threads.
+    """
+    
+    def __init__(self, path: Path):
+        """
+        Open (or create) the cache database.
+        
+        Args:
+            path: SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS matches ("
+                "region TEXT NOT NULL, match_id TEXT NOT NULL, body BLOB NOT NULL, "
+                "PRIMARY KEY (region, match_id))"
+            )
+            self._conn.commit()
+    
+    def get(self, region: str, match_id: str) -> Optional[Dict[str, Any]]:
+        """Return the stored match details, or None on a miss"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body FROM matches WHERE region = ? AND match_id = ?",
+                (region, match_id)
+            ).fetchone()
+        return loads_json(row[0]) if row else None
+    
+    def set(self, region: str, match_id: str, match_details: Dict[str, Any]) -> None:
+        """Store match details"""
+        body = dumps_json(match_details)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO matches (region, match_id, body) VALUES (?, ?, ?)",
+                (region, match_id, body)
+            )
+            self._conn.commit()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM matches").fetchone()[0]
+    
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+
 class TFTMatchCollector(BaseAPIInfrastructure, RiotAPIEndpoints, LeaderboardMixin):
     """
     Match collection system with deduplication.
@@ -51,6 +112,8 @@ class TFTMatchCollector(BaseAPIInfrastructure, RiotAPIEndpoints, LeaderboardMixi
         
         # Match cache for deduplication
         self.match_cache = {}  # match_id -> match_details
+        # Optional on-disk cache of raw match details shared across runs
+        self.persistent_cache: Optional[PersistentMatchCache] = None
         self.cache_stats = {
             'total_matches_requested': 0,
             'unique_matches_fetched': 0,
@@ -107,7 +170,8 @@ class TFTMatchCollector(BaseAPIInfrastructure, RiotAPIEndpoints, LeaderboardMixi
                                              match_count_per_player: int = 50,
                                              start_time: Optional[int] = None,
                                              end_time: Optional[int] = None,
-                                             checkpoint_file: Optional[Path] = None) -> Dict[str, Any]:
+                                             checkpoint_file: Optional[Path] = None,
+                                             max_workers: int = 1) -> Dict[str, Any]:
         """
         Collection of matches for multiple players with deduplication and checkpointing.
         
@@ -117,6 +181,8 @@ class TFTMatchCollector(BaseAPIInfrastructure, RiotAPIEndpoints, LeaderboardMixi
             start_time: Optional start time filter (epoch timestamp)
             end_time: Optional end time filter (epoch timestamp)
             checkpoint_file: Optional path to save/load checkpoint
+            max_workers: Number of match-ID and match-detail requests kept in
+                flight; the shared rate limiter still paces the actual API calls
             
         Returns:
             Dict containing collection results with statistics
@@ -152,8 +218,7 @@ class TFTMatchCollector(BaseAPIInfrastructure, RiotAPIEndpoints, LeaderboardMixi
         if checkpoint_file and checkpoint_file.exists():
             try:
                 logger.info(f"Loading checkpoint from {checkpoint_file}...")
-                with open(checkpoint_file, 'r') as f:
-                    checkpoint_data = json.load(f)
+                checkpoint_data = loads_json(checkpoint_file.read_bytes())
                 
                 # Restore state
                 if 'matches' in checkpoint_data:
@@ -182,23 +247,28 @@ class TFTMatchCollector(BaseAPIInfrastructure, RiotAPIEndpoints, LeaderboardMixi
             logger.info("Phase 1: SKIPPED (restored from checkpoint)")
         else:
             logger.info("Phase 1: Collecting match IDs from all players...")
-            for i, puuid in enumerate(player_puuids):
+            
+            def fetch_match_ids(puuid: str) -> Optional[List[str]]:
+                if start_time or end_time:
+                    # Time-based collection
+                    return self.get_match_ids_by_puuid(
+                        puuid=puuid,
+                        count=match_count_per_player,
+                        start_time=start_time,
+                        end_time=end_time
+                    )
+                # Count-based collection
+                return self.get_match_ids_by_puuid(
+                    puuid=puuid,
+                    count=match_count_per_player
+                )
+            
+            id_lists = self._fetch_in_order(fetch_match_ids, player_puuids, max_workers)
+            for i, (puuid, match_ids, fetch_error) in enumerate(id_lists):
                 try:
                     # Get match IDs for this player
-                    if start_time or end_time:
-                        # Time-based collection
-                        match_ids = self.get_match_ids_by_puuid(
-                            puuid=puuid,
-                            count=match_count_per_player,
-                            start_time=start_time,
-                            end_time=end_time
-                        )
-                    else:
-                        # Count-based collection
-                        match_ids = self.get_match_ids_by_puuid(
-                            puuid=puuid,
-                            count=match_count_per_player
-                        )
+                    if fetch_error is not None:
+                        raise fetch_error
                     
                     if match_ids:
                         player_match_mapping[puuid] = match_ids
@@ -257,11 +327,28 @@ class TFTMatchCollector(BaseAPIInfrastructure, RiotAPIEndpoints, LeaderboardMixi
         matches_fetched = 0
         failed_match_fetches = []  # Track failed fetches for summary
         
+        # Uncached matches are fetched ahead (concurrently when max_workers > 1)
+        # and consumed below in the same order, so all bookkeeping stays serial.
+        fetched = self._fetch_in_order(
+            self._fetch_match_details,
+            [match_id for match_id in all_match_ids if match_id not in self.match_cache],
+            max_workers
+        )
+        
         try:
             for i, match_id in enumerate(all_match_ids):
+                # Uncached matches take the next prefetched result. Its key must
+                # be this match; a mismatch means the two orders diverged, which
+                # is a bug rather than a per-match fetch failure, so it propagates.
+                cached = match_id in self.match_cache
+                if not cached:
+                    fetched_id, match_details, fetch_error = next(fetched)
+                    if fetched_id != match_id:
+                        raise RuntimeError(f"Prefetched details for {fetched_id} "
+                                           f"arrived while processing {match_id}")
                 try:
                     # Check if we already have this match in cache
-                    if match_id in self.match_cache:
+                    if cached:
                         self.cache_stats['cache_hits'] += 1
                         cached_match = self.match_cache[match_id]
                         if "@type" not in cached_match:
@@ -276,8 +363,9 @@ class TFTMatchCollector(BaseAPIInfrastructure, RiotAPIEndpoints, LeaderboardMixi
                                 cached_match["riot_match_id"] = match_id
                         results['matches'][match_id] = cached_match
                     else:
-                        # Fetch match details
-                        match_details = self.get_match_details(match_id)
+                        # Match details were fetched ahead, above
+                        if fetch_error is not None:
+                            raise fetch_error
                         if match_details:
                             # Check if match is incomplete (special queues or <8 participants)
                             info = match_details.get('info', {})
@@ -349,8 +437,7 @@ class TFTMatchCollector(BaseAPIInfrastructure, RiotAPIEndpoints, LeaderboardMixi
                         logger.error("[ERROR] API Key Expired (403 Forbidden). Saving checkpoint and exiting...")
                         if checkpoint_file:
                             try:
-                                with open(checkpoint_file, 'w') as f:
-                                    json.dump(results, f, indent=2, ensure_ascii=False)
+                                checkpoint_file.write_bytes(dumps_json(results, indent=True))
                                 logger.info(f"[SUCCESS] Checkpoint saved to {checkpoint_file}")
                             except Exception as save_error:
                                 logger.error(f"[ERROR] Failed to save checkpoint: {save_error}")
@@ -365,8 +452,7 @@ class TFTMatchCollector(BaseAPIInfrastructure, RiotAPIEndpoints, LeaderboardMixi
                 if checkpoint_file and (i + 1) % 500 == 0:
                     try:
                         logger.info(f"Saving checkpoint to {checkpoint_file}...")
-                        with open(checkpoint_file, 'w') as f:
-                            json.dump(results, f, indent=2, ensure_ascii=False)
+                        checkpoint_file.write_bytes(dumps_json(results, indent=True))
                     except Exception as e:
                         logger.error(f"[WARNING] Failed to save checkpoint: {e}")
 
@@ -374,12 +460,13 @@ class TFTMatchCollector(BaseAPIInfrastructure, RiotAPIEndpoints, LeaderboardMixi
             logger.warning("[WARNING] Collection interrupted! Saving checkpoint...")
             if checkpoint_file:
                 try:
-                    with open(checkpoint_file, 'w') as f:
-                        json.dump(results, f, indent=2, ensure_ascii=False)
+                    checkpoint_file.write_bytes(dumps_json(results, indent=True))
                     logger.info(f"[SUCCESS] Checkpoint saved to {checkpoint_file}")
                 except Exception as e:
                     logger.error(f"[ERROR] Failed to save checkpoint: {e}")
             raise
+        finally:
+            fetched.close()
 
         # Log summary of failed fetches
         if failed_match_fetches:
@@ -505,6 +592,61 @@ class TFTMatchCollector(BaseAPIInfrastructure, RiotAPIEndpoints, LeaderboardMixi
         
         return results
     
+    def _fetch_match_details(self, match_id: str) -> Optional[Dict[str, Any]]:
+        """Get match details, going through the persistent cache when enabled"""
+        store = self.persistent_cache
+        if store is None:
+            return self.get_match_details(match_id)
+        
+        match_details = store.get(self.regional_host, match_id)
+        if match_details is None:
+            match_details = self.get_match_details(match_id)
+            if match_details:
+                store.set(self.regional_host, match_id, match_details)
+        return match_details
+    
+    def _fetch_in_order(self, fetch: Callable[[str], Any], keys: Iterable[str],
+                        max_workers: int = 1) -> Iterator[Tuple[str, Any, Optional[Exception]]]:
+        """
+        Call fetch(key) for each key, yielding (key, result, error) in input order.
+        
+        With max_workers > 1 the calls run on a thread pool with a bounded number
+        in flight, so request round-trips overlap instead of running back to back.
+        The requester's rate limiter is thread-safe and still paces every call.
+        
+        Args:
+            fetch: Single-argument fetch function, e.g. get_match_details
+            keys: Keys to fetch
+            max_workers: Number of concurrent fetches (1 = sequential)
+        """
+        if max_workers <= 1:
+            for key in keys:
+                try:
+                    yield key, fetch(key), None
+                except Exception as e:
+                    yield key, None, e
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        in_flight = deque()
+        try:
+            for key in keys:
+                in_flight.append((key, executor.submit(fetch, key)))
+                if len(in_flight) >= 2 * max_workers:
+                    key, future = in_flight.popleft()
+                    error = future.exception()
+                    yield key, None if error else future.result(), error
+            while in_flight:
+                key, future = in_flight.popleft()
+                error = future.exception()
+                yield key, None if error else future.result(), error
+        finally:
+            # Stop issuing requests if the consumer bails out early (e.g. 403);
+            # cancelled by hand since shutdown(cancel_futures=) needs Python 3.9
+            for _, future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=True)
+    
     def get_cache_statistics(self) -> Dict[str, Any]:
         """
         Get comprehensive statistics about match cache performance.
@@ -718,13 +860,15 @@ class TFTMatchCollector(BaseAPIInfrastructure, RiotAPIEndpoints, LeaderboardMixi
     
     def collect_matches_with_time_filter(self,
                                                  player_puuids: List[str],
-                                                 preset: str = "last_7_days") -> Dict[str, Any]:
+                                                 preset: str = "last_7_days",
+                                                 max_workers: int = 1) -> Dict[str, Any]:
         """
         time-filtered match collection using presets.
         
         Args:
             player_puuids: List of player UUIDs
             preset: Time preset (last_7_days, last_30_days, since_2024, etc.)
+            max_workers: Number of match-ID and match-detail requests kept in flight
             
         Returns:
             collection results
@@ -752,7 +896,8 @@ class TFTMatchCollector(BaseAPIInfrastructure, RiotAPIEndpoints, LeaderboardMixi
             player_puuids=player_puuids,
             match_count_per_player=1000,  # High count for time-based collection
             start_time=start_time,
-            end_time=end_time
+            end_time=end_time,
+            max_workers=max_workers
         )
     
     
@@ -795,6 +940,10 @@ class TFTMatchCollector(BaseAPIInfrastructure, RiotAPIEndpoints, LeaderboardMixi
         """Save collected data to JSON file - delegates to utility function"""
         return save_data_to_file(self.collected_data, filename)
     
+    def save_data_stream(self, filename: str = None):
+        """Stream collected data to a JSON file - returns (path, bytes written) or None"""
+        return save_data_stream(self.collected_data, filename)
+    
     def load_data_from_file(self, filename: str):
         """Load data from JSON file - delegates to utility function"""
         from scripts.utils import load_data_from_file
@@ -807,7 +956,8 @@ class TFTMatchCollector(BaseAPIInfrastructure, RiotAPIEndpoints, LeaderboardMixi
     def collect_matches_since_date(self, 
                                   players_count: int = 1000,
                                   since_date: str = "2024-01-01",
-                                  preset: Optional[str] = None) -> Dict[str, Any]:
+                                  preset: Optional[str] = None,
+                                  max_workers: int = 1) -> Dict[str, Any]:
         """
         Pipeline-compatible method to collect matches since a specific date.
         
@@ -815,6 +965,7 @@ class TFTMatchCollector(BaseAPIInfrastructure, RiotAPIEndpoints, LeaderboardMixi
             players_count: Number of top players to collect from
             since_date: Date string (YYYY-MM-DD) or preset name  
             preset: Use preset date range ("since_2024", "since_2025", "last_30_days", etc.)
+            max_workers: Number of match-ID and match-detail requests kept in flight
             
         Returns:
             Dictionary containing all collected data with pipeline-compliant structure
@@ -832,14 +983,16 @@ class TFTMatchCollector(BaseAPIInfrastructure, RiotAPIEndpoints, LeaderboardMixi
             logger.info(f"Using preset date range: {preset}")
             collection_results = self.collect_matches_with_time_filter(
                 player_puuids=top_puuids,
-                preset=preset
+                preset=preset,
+                max_workers=max_workers
             )
         else:
             # For custom date, use last_7_days as fallback (can be enhanced later)
             logger.info(f"Collecting matches since {since_date} (using last_7_days preset)")
             collection_results = self.collect_matches_with_time_filter(
                 player_puuids=top_puuids,
-                preset="last_7_days"
+                preset="last_7_days",
+                max_workers=max_workers
             )
         
         # Step 3: Build pipeline-compliant data structure with full JSON-LD semantics
@@ -4,9 +4,11 @@ Implements Riot Games API rate limits with dual-window tracking and intelligent
 """
 
 import time
+import threading
 import requests
 import json
 import random
+from collections import deque
 from typing import Dict, List, Optional, Any, Callable, Tuple
 import logging
 from datetime import datetime, timedelta
@@ -68,34 +70,37 @@ class RateLimiter:
         Initialize rate limiter with configuration
         """
         self.config = config or RateLimitConfig()
-        self.request_times: List[float] = []
+        # Monotonic timestamps of requests in the last 2 minutes, oldest first
+        self.request_times: deque = deque()
         self.stats = RateLimitStats()
         self.last_429_time: Optional[float] = None
         self.recent_429_count: int = 0
         self.rate_adjustment_window_start: float = time.time()
+        self._lock = threading.Lock()
         
         logger.info(f"Rate limiter initialized: {self.config.max_requests_per_second} req/s, "
                    f"{self.config.max_requests_per_2_minutes} req/2min")
     
     def record_429_error(self) -> None:
         """Record a 429 error for dynamic rate adjustment"""
-        current_time = time.time()
-        self.stats.rate_429_count += 1
-        self.recent_429_count += 1
-        self.last_429_time = current_time
-        
-        if current_time - self.rate_adjustment_window_start > 300:
-            self.recent_429_count = 1
-            self.rate_adjustment_window_start = current_time
-        
-        if self.recent_429_count > 5:
-            reduction = min(0.5, (self.recent_429_count - 5) * 0.1)
-            self.stats.dynamic_rate_adjustment = max(0.5, 1.0 - reduction)
-            logger.warning(f"Dynamic rate adjustment: {self.stats.dynamic_rate_adjustment:.2f}x "
-                          f"(due to {self.recent_429_count} recent 429 errors)")
-        else:
-            if self.stats.dynamic_rate_adjustment < 1.0:
-                self.stats.dynamic_rate_adjustment = min(1.0, self.stats.dynamic_rate_adjustment + 0.05)
+        with self._lock:
+            current_time = time.time()
+            self.stats.rate_429_count += 1
+            self.recent_429_count += 1
+            self.last_429_time = current_time
+            
+            if current_time - self.rate_adjustment_window_start > 300:
+                self.recent_429_count = 1
+                self.rate_adjustment_window_start = current_time
+            
+            if self.recent_429_count > 5:
+                reduction = min(0.5, (self.recent_429_count - 5) * 0.1)
+                self.stats.dynamic_rate_adjustment = max(0.5, 1.0 - reduction)
+                logger.warning(f"Dynamic rate adjustment: {self.stats.dynamic_rate_adjustment:.2f}x "
+                              f"(due to {self.recent_429_count} recent 429 errors)")
+            else:
+                if self.stats.dynamic_rate_adjustment < 1.0:
+                    self.stats.dynamic_rate_adjustment = min(1.0, self.stats.dynamic_rate_adjustment + 0.05)
     
     def get_effective_rate_limit(self) -> Tuple[int, int]:
         """Get effective rate limits with dynamic adjustment"""
@@ -105,52 +110,81 @@ class RateLimiter:
     
     def check_and_wait(self) -> None:
         """
-        Check rate limits and sleep if necessary to prevent violations
+        Check rate limits and sleep if necessary to prevent violations.
+        
+        Safe to call from multiple threads. The wait is computed under the
+        lock but slept outside it, so one waiting caller does not block the
+        others; after sleeping the windows are checked again, since other
+        threads may have taken the freed slots meanwhile.
         """
-        current_time = time.time()
+        while True:
+            with self._lock:
+                sleep_time = self._reserve_slot()
+            if sleep_time <= 0:
+                return
+            time.sleep(sleep_time)
+    
+    def _expire_requests(self, current_time: float) -> None:
+        """Drop timestamps that have left the 2-minute window"""
+        request_times = self.request_times
+        while request_times and current_time - request_times[0] >= 120:
+            request_times.popleft()
+    
+    def _count_last_second(self, current_time: float) -> int:
+        """Count requests in the last second, walking back from the newest"""
+        count = 0
+        for t in reversed(self.request_times):
+            if current_time - t >= 1:
+                break
+            count += 1
+        return count
+    
+    def _reserve_slot(self) -> float:
+        """
+        Record a request if both windows have room, for a caller holding the lock
         
-        self.request_times = [t for t in self.request_times if current_time - t < 120]
+        Returns:
+            float: 0 if the request was recorded, else seconds to wait before
+                checking again
+        """
+        current_time = time.monotonic()
         
-        self.stats.requests_1s = len([t for t in self.request_times if current_time - t < 1])
+        self._expire_requests(current_time)
+        
+        self.stats.requests_1s = self._count_last_second(current_time)
         self.stats.requests_2m = len(self.request_times)
         
         effective_1s, effective_2m = self.get_effective_rate_limit()
         
         if self.stats.requests_1s >= effective_1s:
-            recent_requests = [t for t in self.request_times if current_time - t < 1]
-            sleep_time = 1.0 - (current_time - recent_requests[0]) + self.config.buffer_time
+            oldest_recent = self.request_times[-self.stats.requests_1s]
+            sleep_time = 1.0 - (current_time - oldest_recent) + self.config.buffer_time
             sleep_time = max(sleep_time, self.config.min_sleep_time)
             
             logger.debug(f"1-second rate limit reached ({self.stats.requests_1s}/{effective_1s}). "
                         f"Sleeping for {sleep_time:.2f} seconds")
             
             self.stats.rate_limit_hits_1s += 1
-            time.sleep(sleep_time)
-            current_time = time.time()
-            self.request_times = [t for t in self.request_times if current_time - t < 120]
+            return sleep_time
         
         available_slots = effective_2m - len(self.request_times)
-        if available_slots < self.config.proactive_2m_buffer:
-            if len(self.request_times) > 0:
-                requests_to_wait = self.config.proactive_2m_buffer - available_slots
-                
-                if requests_to_wait > 0 and requests_to_wait < len(self.request_times):
-                    target_request_idx = requests_to_wait
-                    target_request_age = current_time - self.request_times[target_request_idx]
-                    sleep_time = 120.0 - target_request_age + self.config.buffer_time
-                    sleep_time = max(sleep_time, self.config.min_sleep_time)
-                else:
-                    age_of_oldest = current_time - self.request_times[0]
-                    sleep_time = 120.0 - age_of_oldest + self.config.buffer_time
-                    sleep_time = max(sleep_time, self.config.min_sleep_time)
-                
-                logger.debug(f"Proactive 2-minute rate limit check: {len(self.request_times)}/{effective_2m} "
-                           f"(only {available_slots} slots available, need {self.config.proactive_2m_buffer}). "
-                           f"Sleeping for {sleep_time:.2f} seconds")
-                
-                time.sleep(sleep_time)
-                current_time = time.time()
-                self.request_times = [t for t in self.request_times if current_time - t < 120]
+        if available_slots < self.config.proactive_2m_buffer and len(self.request_times) > 0:
+            requests_to_wait = self.config.proactive_2m_buffer - available_slots
+            
+            if requests_to_wait > 0 and requests_to_wait < len(self.request_times):
+                target_request_idx = requests_to_wait
+                target_request_age = current_time - self.request_times[target_request_idx]
+                sleep_time = 120.0 - target_request_age + self.config.buffer_time
+                sleep_time = max(sleep_time, self.config.min_sleep_time)
+            else:
+                age_of_oldest = current_time - self.request_times[0]
+                sleep_time = 120.0 - age_of_oldest + self.config.buffer_time
+                sleep_time = max(sleep_time, self.config.min_sleep_time)
+            
+            logger.debug(f"Proactive 2-minute rate limit check: {len(self.request_times)}/{effective_2m} "
+                       f"(only {available_slots} slots available, need {self.config.proactive_2m_buffer}). "
+                       f"Sleeping for {sleep_time:.2f} seconds")
+            return sleep_time
         
         if len(self.request_times) >= effective_2m:
             age_of_oldest = current_time - self.request_times[0]
@@ -162,23 +196,24 @@ class RateLimiter:
                        f"Sleeping for {sleep_time:.2f} seconds")
             
             self.stats.rate_limit_hits_2m += 1
-            time.sleep(sleep_time)
-            current_time = time.time()
-            self.request_times = [t for t in self.request_times if current_time - t < 120]
+            return sleep_time
         
-        self.request_times.append(time.time())
+        self.request_times.append(current_time)
         self.stats.total_requests += 1
         self.stats.last_request_time = time.time()
+        return 0.0
     
     def get_stats(self) -> Dict[str, Any]:
         """Get current rate limiting statistics"""
-        current_time = time.time()
-        self.stats.requests_1s = len([t for t in self.request_times if current_time - t < 1])
-        self.stats.requests_2m = len([t for t in self.request_times if current_time - t < 120])
-        
-        effective_1s, effective_2m = self.get_effective_rate_limit()
-        
-        stats_dict = self.stats.to_dict()
+        # Worker threads append to request_times concurrently; count under the lock
+        with self._lock:
+            current_time = time.monotonic()
+            self.stats.requests_1s = self._count_last_second(current_time)
+            self.stats.requests_2m = sum(1 for t in self.request_times if current_time - t < 120)
+            
+            effective_1s, effective_2m = self.get_effective_rate_limit()
+            
+            stats_dict = self.stats.to_dict()
         stats_dict.update({
             "rate_limit_1s": f"{self.stats.requests_1s}/{effective_1s}",
             "rate_limit_2m": f"{self.stats.requests_2m}/{effective_2m}",
@@ -7,11 +7,32 @@ Answers the research questions from the project proposal:
 3. How do player strategies adapt to game updates and balance changes?
 """
 
+import functools
+import heapq
 import json
 import os
+import re
+from array import array
 from collections import Counter, defaultdict
 from pathlib import Path
 
+import numpy as np
+
+# Set/category prefixes stripped from unit, trait, item and augment ids.
+# More specific prefixes come first so e.g. 'TFT13_Item_' wins over 'TFT13_'.
+_PREFIXES = (
+    'TFT13_Augment_', 'TFT13_Item_', 'TFT_Augment_', 'TFT_Item_',
+    'TFT13_', 'TFT12_', 'Set13_', 'Set12_',
+)
+
+@functools.lru_cache(maxsize=None)
+def norm(s):
+    """Strip the first matching set/category prefix from an id."""
+    for p in _PREFIXES:
+        if s.startswith(p):
+            return s[len(p):]
+    return s
+
 def load_collection(filepath):
     """Load a collection JSON file."""
     try:
@@ -22,35 +43,117 @@ def load_collection(filepath):
         return {'players': {}}
 
 def extract_matches_from_collection(data):
-    """Extract all matches from a collection."""
-    matches = []
+    """Yield (match_id, match) pairs for every match in a collection."""
     if 'players' in data:
         for player_id, player_data in data['players'].items():
             if 'matches' in player_data and player_data['matches']:
                 for match_id, match_data in player_data['matches'].items():
                     if match_data and 'info' in match_data:
-                        matches.append(match_data)
-    return matches
+                        yield match_id, match_data
 
-def analyze_unit_meta(matches, collection_date):
-    """Analyze champion/unit usage and performance."""
-    unit_placements = defaultdict(list)  # unit -> list of placements
-    unit_counts = Counter()
+def _placement_array():
+    """Compact placement store: placements (1-8) fit in a signed byte."""
+    return array('b')
+
+def _fits_byte(value):
+    """Whether value can be stored in an array('b') without OverflowError."""
+    return isinstance(value, int) and -128 <= value <= 127
+
+def new_aggregates():
+    """Create empty running accumulators for aggregate_matches()."""
+    return {
+        'unit_placements': defaultdict(_placement_array),
+        'trait_placements': defaultdict(_placement_array),
+        'trait_combinations': defaultdict(_placement_array),
+        'augment_placements': defaultdict(_placement_array),
+        'item_placements': defaultdict(_placement_array),
+        'raw_versions': Counter(),
+        'placement_counts': Counter(),
+        'level_counts': Counter(),
+        'participant_count': 0,
+    }
+
+def aggregate_matches(matches, agg=None):
+    """
+    Accumulate every per-match statistic in a single pass over matches.
+    
+    Adds into agg (a new_aggregates() dict) when given, so collections can be
+    aggregated one file at a time and released before the next is loaded.
+    """
+    if agg is None:
+        agg = new_aggregates()
+    unit_placements = agg['unit_placements']
+    trait_placements = agg['trait_placements']
+    trait_combinations = agg['trait_combinations']
+    augment_placements = agg['augment_placements']
+    item_placements = agg['item_placements']
+    raw_versions = agg['raw_versions']
+    
+    # Signed-byte buffers for the histograms, viewed as numpy arrays afterwards;
+    # appended to rather than preallocated, as lobby sizes vary
+    placements = array('b')
+    levels = array('b')
+    participant_count = 0
     
     for match in matches:
-        if 'info' not in match or 'participants' not in match['info']:
+        info = match.get('info')
+        if not info:
             continue
-        for participant in match['info']['participants']:
-            placement = participant.get('placement', 8)
-            units = participant.get('units', [])
-            for unit in units:
-                unit_id = unit.get('character_id', 'Unknown')
-                unit_placements[unit_id].append(placement)
-                unit_counts[unit_id] += 1
+        raw_versions[info.get('game_version', 'Unknown')] += 1
+        
+        for participant in info.get('participants') or ():
+            participant_count += 1
+            # Missing, non-integer or out-of-range values (e.g. null) are left out
+            level = participant.get('level', 0)
+            if _fits_byte(level):
+                levels.append(level)
+            placement = participant.get('placement')
+            if not _fits_byte(placement):
+                # The placement arrays only hold signed bytes; skip unplaced participants
+                continue
+            placements.append(placement)
+            
+            for unit in participant.get('units', ()):
+                unit_placements[norm(unit.get('character_id', 'Unknown'))].append(placement)
+                
+                # Item lists hold names or numeric ids; anything else (e.g. null) is skipped
+                for item in unit.get('itemNames') or unit.get('items') or ():
+                    if isinstance(item, str):
+                        item_placements[norm(item)].append(placement)
+                    elif isinstance(item, int):
+                        item_placements[f"Item_{item}"].append(placement)
+            
+            active_traits = []
+            for trait in participant.get('traits', ()):
+                if trait.get('tier_current', 0) > 0:
+                    trait_name = norm(trait.get('name', 'Unknown'))
+                    trait_placements[trait_name].append(placement)
+                    active_traits.append(trait_name)
+            
+            # Track trait combinations for top 4
+            if placement <= 4 and len(active_traits) >= 2:
+                combo_key = tuple(sorted(active_traits[:3]))  # Top 3 traits
+                trait_combinations[combo_key].append(placement)
+            
+            for augment in participant.get('augments', ()):
+                if isinstance(augment, str):
+                    augment_placements[norm(augment)].append(placement)
+    
+    places, place_totals = np.unique(np.frombuffer(placements, dtype=np.int8), return_counts=True)
+    agg['placement_counts'].update(dict(zip(places.tolist(), place_totals.tolist())))
+    level_values, level_totals = np.unique(np.frombuffer(levels, dtype=np.int8), return_counts=True)
+    agg['level_counts'].update(dict(zip(level_values.tolist(), level_totals.tolist())))
+    agg['participant_count'] += participant_count
+    return agg
+
+def summarize_unit_meta(agg):
+    """Champion/unit usage and performance from aggregated placements."""
+    unit_counts = Counter({unit_id: len(placements)
+                           for unit_id, placements in agg['unit_placements'].items()})
     
     # Calculate average placement per unit (lower is better)
     unit_performance = {}
-    for unit_id, placements in unit_placements.items():
+    for unit_id, placements in agg['unit_placements'].items():
         if len(placements) >= 10:  # Minimum sample size
             avg_placement = sum(placements) / len(placements)
             unit_performance[unit_id] = {
@@ -61,33 +164,10 @@ def analyze_unit_meta(matches, collection_date):
     
     return unit_performance, unit_counts
 
-def analyze_trait_synergies(matches):
-    """Analyze which traits contribute to wins."""
-    trait_placements = defaultdict(list)
-    trait_combinations = defaultdict(list)
-    
-    for match in matches:
-        if 'info' not in match or 'participants' not in match['info']:
-            continue
-        for participant in match['info']['participants']:
-            placement = participant.get('placement', 8)
-            traits = participant.get('traits', [])
-            
-            active_traits = []
-            for trait in traits:
-                if trait.get('tier_current', 0) > 0:
-                    trait_name = trait.get('name', 'Unknown')
-                    trait_placements[trait_name].append(placement)
-                    active_traits.append(trait_name)
-            
-            # Track trait combinations for top 4
-            if placement <= 4 and len(active_traits) >= 2:
-                combo_key = tuple(sorted(active_traits[:3]))  # Top 3 traits
-                trait_combinations[combo_key].append(placement)
-    
-    # Calculate trait performance
+def summarize_trait_synergies(agg):
+    """Trait performance and top-4 trait combinations from aggregated placements."""
     trait_performance = {}
-    for trait, placements in trait_placements.items():
+    for trait, placements in agg['trait_placements'].items():
         if len(placements) >= 20:
             trait_performance[trait] = {
                 'avg_placement': round(sum(placements) / len(placements), 2),
@@ -95,24 +175,12 @@ def analyze_trait_synergies(matches):
                 'top4_rate': round(sum(1 for p in placements if p <= 4) / len(placements) * 100, 1)
             }
     
-    return trait_performance, trait_combinations
+    return trait_performance, agg['trait_combinations']
 
-def analyze_augments(matches):
-    """Analyze augment usage and effectiveness."""
-    augment_placements = defaultdict(list)
-    
-    for match in matches:
-        if 'info' not in match or 'participants' not in match['info']:
-            continue
-        for participant in match['info']['participants']:
-            placement = participant.get('placement', 8)
-            augments = participant.get('augments', [])
-            
-            for augment in augments:
-                augment_placements[augment].append(placement)
-    
+def summarize_augments(agg):
+    """Augment usage and effectiveness from aggregated placements."""
     augment_performance = {}
-    for augment, placements in augment_placements.items():
+    for augment, placements in agg['augment_placements'].items():
         if len(placements) >= 10:
             augment_performance[augment] = {
                 'avg_placement': round(sum(placements) / len(placements), 2),
@@ -122,27 +190,10 @@ def analyze_augments(matches):
     
     return augment_performance
 
-def analyze_items(matches):
-    """Analyze item usage patterns."""
-    item_placements = defaultdict(list)
-    
-    for match in matches:
-        if 'info' not in match or 'participants' not in match['info']:
-            continue
-        for participant in match['info']['participants']:
-            placement = participant.get('placement', 8)
-            units = participant.get('units', [])
-            
-            for unit in units:
-                items = unit.get('itemNames', []) or unit.get('items', [])
-                for item in items:
-                    if isinstance(item, str):
-                        item_placements[item].append(placement)
-                    elif isinstance(item, int):
-                        item_placements[f"Item_{item}"].append(placement)
-    
+def summarize_items(agg):
+    """Item usage patterns from aggregated placements."""
     item_performance = {}
-    for item, placements in item_placements.items():
+    for item, placements in agg['item_placements'].items():
         if len(placements) >= 10:
             item_performance[item] = {
                 'avg_placement': round(sum(placements) / len(placements), 2),
@@ -152,21 +203,46 @@ def analyze_items(matches):
     
     return item_performance
 
-def analyze_game_versions(matches):
-    """Track game versions across matches."""
+def analyze_unit_meta(matches, collection_date):
+    """Analyze champion/unit usage and performance."""
+    return summarize_unit_meta(aggregate_matches(matches))
+
+def analyze_trait_synergies(matches):
+    """Analyze which traits contribute to wins."""
+    return summarize_trait_synergies(aggregate_matches(matches))
+
+def analyze_augments(matches):
+    """Analyze augment usage and effectiveness."""
+    return summarize_augments(aggregate_matches(matches))
+
+def analyze_items(matches):
+    """Analyze item usage patterns."""
+    return summarize_items(aggregate_matches(matches))
+
+_VER_RE = re.compile(r'Version (\d+\.\d+)')
+
+@functools.lru_cache(maxsize=None)
+def _patch_of(version):
+    """Extract the patch (e.g. "15.22") from a full game_version string, or None."""
+    if 'Version' not in version:
+        return None
+    m = _VER_RE.search(version)
+    return m.group(1) if m else 'Unknown'
+
+def summarize_game_versions(agg):
+    """Patch counts from aggregated raw game_version strings."""
+    # game_version strings repeat per patch/region: each distinct string is parsed once
     versions = Counter()
-    for match in matches:
-        if 'info' in match:
-            version = match['info'].get('game_version', 'Unknown')
-            # Extract patch version (e.g., "15.22" from full string)
-            if 'Version' in version:
-                try:
-                    patch = version.split('Version ')[1].split('.')[0:2]
-                    versions['.'.join(patch)] += 1
-                except:
-                    versions['Unknown'] += 1
+    for version, count in agg['raw_versions'].items():
+        patch = _patch_of(version)
+        if patch is not None:
+            versions[patch] += count
     return versions
 
+def analyze_game_versions(matches):
+    """Track game versions across matches."""
+    return summarize_game_versions(aggregate_matches(matches))
+
 def main():
     """Main analysis function."""
     data_dir = Path('/Users/jugarte/Documents/tft-data-extraction/data/raw')
@@ -178,8 +254,12 @@ def main():
     print("TFT DATA ANALYSIS - RESEARCH QUESTIONS")
     print("=" * 80)
     
-    all_matches = []
+    seen = set()  # match_ids already collected; players share matches across collections
     collection_stats = {}
+    tier_counts = Counter()
+    # Running accumulators: each collection is aggregated and released before the
+    # next one is loaded, so peak memory is bounded by the largest single file
+    agg = new_aggregates()
     
     for filepath in collection_files:
         if 'backup' in str(filepath):
@@ -188,24 +268,30 @@ def main():
         print(f"\nLoading {filepath.name}...")
         
         data = load_collection(filepath)
-        matches = extract_matches_from_collection(data)
+        match_count = 0
+        new_matches = []
+        # Deduplicate by match_id while streaming so duplicates are never retained
+        for match_id, match in extract_matches_from_collection(data):
+            match_count += 1
+            if match_id in seen:
+                continue
+            seen.add(match_id)
+            new_matches.append(match)
+        
+        for player_data in data.get('players', {}).values():
+            tier_counts[player_data.get('tier', 'Unknown')] += 1
         
         collection_stats[date_str] = {
-            'match_count': len(matches),
+            'match_count': match_count,
             'player_count': len(data.get('players', {}))
         }
-        all_matches.extend(matches)
-        print(f"  Found {len(matches)} matches from {len(data.get('players', {}))} players")
-    
-    # Deduplicate matches by match_id
-    unique_matches = {}
-    for match in all_matches:
-        if 'metadata' in match and 'match_id' in match['metadata']:
-            unique_matches[match['metadata']['match_id']] = match
-    all_matches = list(unique_matches.values())
+        print(f"  Found {match_count} matches from {len(data.get('players', {}))} players")
+        
+        aggregate_matches(new_matches, agg)
+        del data, new_matches
     
     print(f"\n{'=' * 80}")
-    print(f"TOTAL: {len(all_matches)} unique matches across {len(collection_stats)} collections")
+    print(f"TOTAL: {len(seen)} unique matches across {len(collection_stats)} collections")
     print(f"{'=' * 80}")
     
     # ================================================================
@@ -215,41 +301,38 @@ def main():
     print("RESEARCH QUESTION 1: How do champion and item meta-games evolve over time?")
     print("=" * 80)
     
-    unit_perf, unit_counts = analyze_unit_meta(all_matches, "all")
+    unit_perf, unit_counts = summarize_unit_meta(agg)
     
     # Top 15 most picked champions
     print("\n>> TOP 15 MOST PICKED CHAMPIONS:")
     print("-" * 60)
-    top_units = sorted(unit_perf.items(), key=lambda x: x[1]['pick_count'], reverse=True)[:15]
+    top_units = heapq.nlargest(15, unit_perf.items(), key=lambda x: x[1]['pick_count'])
     print(f"{'Champion':<30} {'Picks':>8} {'Avg Place':>10} {'Top 4%':>8}")
     print("-" * 60)
-    for unit_id, stats in top_units:
-        name = unit_id.replace('TFT13_', '').replace('TFT12_', '')
+    for name, stats in top_units:
         print(f"{name:<30} {stats['pick_count']:>8} {stats['avg_placement']:>10} {stats['win_rate']:>7}%")
     
     # Top 15 best performing champions (by avg placement)
     print("\n>> TOP 15 BEST PERFORMING CHAMPIONS (by avg placement):")
     print("-" * 60)
-    top_performers = sorted(unit_perf.items(), key=lambda x: x[1]['avg_placement'])[:15]
+    top_performers = heapq.nsmallest(15, unit_perf.items(), key=lambda x: x[1]['avg_placement'])
     print(f"{'Champion':<30} {'Picks':>8} {'Avg Place':>10} {'Top 4%':>8}")
     print("-" * 60)
-    for unit_id, stats in top_performers:
-        name = unit_id.replace('TFT13_', '').replace('TFT12_', '')
+    for name, stats in top_performers:
         print(f"{name:<30} {stats['pick_count']:>8} {stats['avg_placement']:>10} {stats['win_rate']:>7}%")
     
     # Item analysis
-    item_perf = analyze_items(all_matches)
+    item_perf = summarize_items(agg)
     print("\n>> TOP 15 MOST USED ITEMS:")
     print("-" * 60)
-    top_items = sorted(item_perf.items(), key=lambda x: x[1]['usage_count'], reverse=True)[:15]
+    top_items = heapq.nlargest(15, item_perf.items(), key=lambda x: x[1]['usage_count'])
     print(f"{'Item':<35} {'Usage':>8} {'Avg Place':>10} {'Top 4%':>8}")
     print("-" * 60)
-    for item, stats in top_items:
-        name = item.replace('TFT_Item_', '').replace('TFT13_Item_', '')
+    for name, stats in top_items:
         print(f"{name:<35} {stats['usage_count']:>8} {stats['avg_placement']:>10} {stats['win_rate']:>7}%")
     
     # Game version tracking
-    versions = analyze_game_versions(all_matches)
+    versions = summarize_game_versions(agg)
     print("\n>> GAME VERSIONS OBSERVED:")
     print("-" * 40)
     for version, count in versions.most_common(5):
@@ -262,37 +345,35 @@ def main():
     print("RESEARCH QUESTION 2: What factors contribute to successful team compositions?")
     print("=" * 80)
     
-    trait_perf, trait_combos = analyze_trait_synergies(all_matches)
+    trait_perf, trait_combos = summarize_trait_synergies(agg)
     
     # Top performing traits
     print("\n>> TOP 15 HIGHEST WIN-RATE TRAITS:")
     print("-" * 60)
-    top_traits = sorted(trait_perf.items(), key=lambda x: x[1]['top4_rate'], reverse=True)[:15]
+    top_traits = heapq.nlargest(15, trait_perf.items(), key=lambda x: x[1]['top4_rate'])
     print(f"{'Trait':<30} {'Picks':>8} {'Avg Place':>10} {'Top 4%':>8}")
     print("-" * 60)
-    for trait, stats in top_traits:
-        name = trait.replace('Set13_', '').replace('Set12_', '')
+    for name, stats in top_traits:
         print(f"{name:<30} {stats['pick_count']:>8} {stats['avg_placement']:>10} {stats['top4_rate']:>7}%")
     
     # Most popular traits
     print("\n>> TOP 15 MOST ACTIVATED TRAITS:")
     print("-" * 60)
-    popular_traits = sorted(trait_perf.items(), key=lambda x: x[1]['pick_count'], reverse=True)[:15]
+    popular_traits = heapq.nlargest(15, trait_perf.items(), key=lambda x: x[1]['pick_count'])
     print(f"{'Trait':<30} {'Picks':>8} {'Avg Place':>10} {'Top 4%':>8}")
     print("-" * 60)
-    for trait, stats in popular_traits:
-        name = trait.replace('Set13_', '').replace('Set12_', '')
+    for name, stats in popular_traits:
         print(f"{name:<30} {stats['pick_count']:>8} {stats['avg_placement']:>10} {stats['top4_rate']:>7}%")
     
     # Augment analysis
-    augment_perf = analyze_augments(all_matches)
+    augment_perf = summarize_augments(agg)
     print("\n>> TOP 15 HIGHEST WIN-RATE AUGMENTS:")
     print("-" * 70)
-    top_augments = sorted(augment_perf.items(), key=lambda x: x[1]['win_rate'], reverse=True)[:15]
+    top_augments = heapq.nlargest(15, augment_perf.items(), key=lambda x: x[1]['win_rate'])
     print(f"{'Augment':<45} {'Picks':>6} {'Avg Place':>10} {'Top 4%':>8}")
     print("-" * 70)
     for augment, stats in top_augments:
-        name = augment.replace('TFT13_Augment_', '').replace('TFT_Augment_', '')[:40]
+        name = augment[:40]
         print(f"{name:<45} {stats['pick_count']:>6} {stats['avg_placement']:>10} {stats['win_rate']:>7}%")
     
     # ================================================================
@@ -303,47 +384,31 @@ def main():
     print("=" * 80)
     
     # Analyze placement distribution
-    placements = []
-    levels = []
-    for match in all_matches:
-        if 'info' not in match or 'participants' not in match['info']:
-            continue
-        for p in match['info']['participants']:
-            placements.append(p.get('placement', 0))
-            levels.append(p.get('level', 0))
+    total_participants = agg['participant_count']
     
     print("\n>> PLACEMENT DISTRIBUTION:")
     print("-" * 40)
-    placement_counts = Counter(placements)
-    for place in sorted(placement_counts.keys()):
+    placement_counts = agg['placement_counts']
+    for place in sorted(placement_counts):
         if place > 0:
             count = placement_counts[place]
-            pct = count / len(placements) * 100
+            pct = count / total_participants * 100
             bar = '█' * int(pct / 2)
             print(f"  {place}: {bar} {pct:.1f}% ({count})")
     
     print("\n>> AVERAGE LEVEL AT GAME END:")
     print("-" * 40)
-    level_counts = Counter(levels)
-    for level in sorted(level_counts.keys()):
+    level_counts = agg['level_counts']
+    for level in sorted(level_counts):
         if level > 0:
             count = level_counts[level]
-            pct = count / len(levels) * 100
+            pct = count / total_participants * 100
             bar = '█' * int(pct / 2)
             print(f"  Level {level}: {bar} {pct:.1f}% ({count})")
     
     # Analyze tier distribution from collection metadata
     print("\n>> PLAYER TIER DISTRIBUTION (from ranked data):")
     print("-" * 40)
-    tier_counts = Counter()
-    for filepath in collection_files:
-        if 'backup' in str(filepath):
-            continue
-        data = load_collection(filepath)
-        for player_id, player_data in data.get('players', {}).items():
-            tier = player_data.get('tier', 'Unknown')
-            tier_counts[tier] += 1
-    
     tier_order = ['CHALLENGER', 'GRANDMASTER', 'MASTER', 'DIAMOND', 'EMERALD', 
                   'PLATINUM', 'GOLD', 'SILVER', 'BRONZE', 'IRON']
     for tier in tier_order:
@@ -379,7 +444,7 @@ def main():
 NOTE: This analysis uses {} matches from {} collection cycles.
 For temporal evolution analysis, more collection cycles over multiple patches
 would strengthen conclusions about meta-game changes over time.
-""".format(len(all_matches), len(all_matches), len(collection_stats)))
+""".format(len(seen), len(seen), len(collection_stats)))
     
     print("=" * 80)
     print("Analysis complete. Results can be added to final report.")
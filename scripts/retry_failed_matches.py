@@ -14,6 +14,7 @@ import json
 import sys
 import argparse
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Optional, Any
 from datetime import datetime
@@ -36,6 +37,9 @@ logger = logging.getLogger(__name__)
 class MatchRetryCollector(BaseAPIInfrastructure, RiotAPIEndpoints):
     """Specialized collector for retrying failed match IDs"""
     
+    # Upper bound on concurrent match fetches; also capped by the per-second rate limit
+    MAX_WORKERS = 20
+    
     def __init__(self, api_key: str, key_type: str = "personal"):
         super().__init__(api_key, key_type)
         self.identifier_system = TFTIdentifierSystem()
@@ -46,10 +50,31 @@ class MatchRetryCollector(BaseAPIInfrastructure, RiotAPIEndpoints):
             'failed_match_ids': []
         }
     
-    def retry_match_ids(self, match_ids: List[str]) -> Dict[str, Any]:
+    def retry_match_ids(self, match_ids: List[str], matches_file: Optional[str] = None) -> Dict[str, Any]:
         """
         Retry fetching match details for a list of match IDs.
+        
+        Requests are issued concurrently from a thread pool sized to the
+        per-second rate limit; the shared rate limiter paces the threads.
+        
+        If matches_file is given, each recovered match is appended to it as one
+        JSON line ({"match_id": ..., "data": ...}) as soon as it arrives and is
+        not kept in memory, so progress survives a crash mid-run. IDs already
+        recorded in an existing matches_file are not fetched again, so re-running
+        with the same output resumes the earlier run instead of duplicating it.
+        
+        Duplicate IDs are dropped (first occurrence wins) so each match is fetched
+        and assigned a persistent identifier only once per run.
         """
+        match_ids = list(dict.fromkeys(match_ids))
+        
+        already_recovered = load_recovered_match_ids(matches_file) if matches_file else set()
+        if already_recovered:
+            skipped = len(match_ids)
+            match_ids = [match_id for match_id in match_ids if match_id not in already_recovered]
+            skipped -= len(match_ids)
+            logger.info(f"Skipping {skipped} match IDs already recovered in {matches_file}")
+        
         logger.info(f"Retrying {len(match_ids)} failed match IDs...")
         
         results = {
@@ -64,42 +89,69 @@ class MatchRetryCollector(BaseAPIInfrastructure, RiotAPIEndpoints):
             'retry_timestamp': datetime.now().isoformat()
         }
         
-        for i, match_id in enumerate(match_ids, 1):
-            logger.info(f"Retrying match {i}/{len(match_ids)}: {match_id}")
-            
-            try:
-                match_details = self.get_match_details(match_id)
+        stream = None
+        if matches_file:
+            Path(matches_file).parent.mkdir(parents=True, exist_ok=True)
+            stream = open(matches_file, 'a', encoding='utf-8')
+            if stream.tell() > 0 and not _ends_with_newline(matches_file):
+                # Terminate a line cut off by a crash so the next record starts cleanly
+                stream.write('\n')
+            results['matches_file'] = str(matches_file)
+        
+        max_workers = max(1, min(self.MAX_WORKERS, self.requester.config.max_requests_per_second))
+        
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(self.get_match_details, match_id): match_id
+                           for match_id in match_ids}
                 
-                if match_details:
-                    persistent_match_id = self.identifier_system.create_match_identifier(
-                        match_id,
-                        match_details
-                    )
-                    
-                    match_details["@type"] = "TFTMatch"
-                    match_details["@id"] = persistent_match_id
-                    match_details["riot_match_id"] = match_id
+                # Identifiers are registered on this thread as results arrive
+                for i, future in enumerate(as_completed(futures), 1):
+                    match_id = futures[future]
+                    logger.debug("Retried match %d/%d: %s", i, len(match_ids), match_id)
                     
-                    results['matches'][match_id] = match_details
-                    results['retry_stats']['successful'] += 1
-                    results['retry_stats']['successful_match_ids'].append(match_id)
-                    logger.info(f"Successfully fetched match {match_id}")
-                else:
-                    results['retry_stats']['failed'] += 1
-                    results['retry_stats']['failed_match_ids'].append(match_id)
-                    logger.warning(f"Failed to fetch match {match_id} (returned None)")
-                    
-            except Exception as e:
-                results['retry_stats']['failed'] += 1
-                results['retry_stats']['failed_match_ids'].append(match_id)
-                logger.error(f"Error fetching match {match_id}: {e}")
+                    try:
+                        match_details = future.result()
+                        
+                        if match_details:
+                            persistent_match_id = self.identifier_system.create_match_identifier(
+                                match_id,
+                                match_details
+                            )
+                            
+                            match_details["@type"] = "TFTMatch"
+                            match_details["@id"] = persistent_match_id
+                            match_details["riot_match_id"] = match_id
+                            
+                            if stream is not None:
+                                stream.write(json.dumps({'match_id': match_id, 'data': match_details},
+                                                        ensure_ascii=False) + '\n')
+                                stream.flush()
+                            else:
+                                results['matches'][match_id] = match_details
+                            results['retry_stats']['successful'] += 1
+                            results['retry_stats']['successful_match_ids'].append(match_id)
+                            logger.debug("Successfully fetched match %s", match_id)
+                        else:
+                            results['retry_stats']['failed'] += 1
+                            results['retry_stats']['failed_match_ids'].append(match_id)
+                            logger.warning("Failed to fetch match %s (returned None)", match_id)
+                            
+                    except Exception as e:
+                        results['retry_stats']['failed'] += 1
+                        results['retry_stats']['failed_match_ids'].append(match_id)
+                        logger.error("Error fetching match %s: %s", match_id, e)
+        finally:
+            if stream is not None:
+                stream.close()
         
         logger.info("=" * 60)
         logger.info("RETRY SUMMARY:")
         logger.info(f"   Total Attempted: {results['retry_stats']['total_attempted']}")
         logger.info(f"   Successful: {results['retry_stats']['successful']}")
         logger.info(f"   Failed: {results['retry_stats']['failed']}")
-        logger.info(f"   Success Rate: {(results['retry_stats']['successful'] / results['retry_stats']['total_attempted'] * 100):.1f}%")
+        if results['retry_stats']['total_attempted']:
+            logger.info(f"   Success Rate: {(results['retry_stats']['successful'] / results['retry_stats']['total_attempted'] * 100):.1f}%")
         logger.info("=" * 60)
         
         return results
@@ -113,6 +165,28 @@ class MatchRetryCollector(BaseAPIInfrastructure, RiotAPIEndpoints):
             logger.error(f"Failed to save retry results to: {output_file}")
 
 
+def load_recovered_match_ids(matches_file: str) -> set:
+    """Match IDs already written to a recovered-matches .jsonl file (empty if missing)"""
+    recovered = set()
+    try:
+        with open(matches_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    recovered.add(json.loads(line)['match_id'])
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    # A line cut off by a crash; that match is fetched again
+                    continue
+    except FileNotFoundError:
+        pass
+    return recovered
+
+
+def _ends_with_newline(path: str) -> bool:
+    with open(path, 'rb') as f:
+        f.seek(-1, 2)
+        return f.read(1) == b'\n'
+
+
 def extract_failed_match_ids_from_file(data_file: str) -> List[str]:
     """Extract failed match IDs from a collection data file"""
     data = load_data_from_file(data_file)
@@ -134,14 +208,13 @@ def extract_failed_match_ids_from_error_summary(error_summary_file: str) -> List
         logger.error(f"Failed to load error summary file: {error_summary_file}")
         return []
     
-    failed_match_ids = error_summary.get('failed_match_ids', [])
+    failed = set(error_summary.get('failed_match_ids', []))
     
     errors_by_category = error_summary.get('errors_by_category', {})
     for category, error_info in errors_by_category.items():
-        category_match_ids = error_info.get('match_ids', [])
-        failed_match_ids.extend(category_match_ids)
+        failed.update(error_info.get('match_ids', []))
     
-    failed_match_ids = list(set(failed_match_ids))
+    failed_match_ids = list(failed)
     
     logger.info(f"Found {len(failed_match_ids)} failed match IDs in {error_summary_file}")
     return failed_match_ids
@@ -186,7 +259,9 @@ Examples:
     parser.add_argument(
         '--output',
         default=None,
-        help='Output file for retry results (default: retry_results_TIMESTAMP.json)'
+        help='Output file for retry statistics (default: retry_results_TIMESTAMP.json); '
+             'recovered matches are appended alongside it as .jsonl, and matches '
+             'already in that file are not retried'
     )
     
     parser.add_argument(
@@ -225,14 +300,16 @@ Examples:
     
     collector = MatchRetryCollector(api_key, args.key_type)
     
-    results = collector.retry_match_ids(match_ids)
-    
     if args.output:
         output_file = args.output
     else:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_file = f"data/retry/retry_results_{timestamp}.json"
     
+    # Recovered matches are streamed next to the stats file as they arrive
+    matches_file = str(Path(output_file).with_suffix('.jsonl'))
+    results = collector.retry_match_ids(match_ids, matches_file=matches_file)
+    
     collector.save_retry_results(results, output_file)
     
     if results['retry_stats']['failed'] > 0:
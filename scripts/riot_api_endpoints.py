@@ -4,11 +4,123 @@ Organized by API category for better maintainability and documentation.
 """
 
 import requests
-from typing import Dict, List, Optional, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Hashable, Tuple
 import logging
 
+from scripts.utils import dumps_json, loads_json
+
 logger = logging.getLogger(__name__)
 
+# Data Dragon files fetched by get_static_data
+STATIC_DATA_TYPES = (
+    "tft-champion",
+    "tft-item",
+    "tft-trait",
+    "tft-augments",
+    "tft-tactician",
+    "tft-queues",
+    "tft-regalia",
+    "tft-arena",
+)
+
+# Response cache lifetimes in seconds, by how often the upstream data changes
+CACHE_TTLS = {
+    "short": 5,         # live games
+    "normal": 60,       # leagues, summoners
+    "long": 24 * 3600,  # finished matches never change
+}
+RESPONSE_CACHE_MAXSIZE = 256
+
+
+def create_ddragon_session() -> requests.Session:
+    """
+    Create a pooled session for the Data Dragon CDN.
+    
+    Transient 429/5xx responses are retried with backoff by the adapter; once
+    retries run out the last response is returned so callers can check it.
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+# Riot API endpoints: name -> (host attribute, path template, cache policy).
+# A policy of None means the response is never cached.
+ENDPOINTS: Dict[str, Tuple[str, str, Optional[str]]] = {
+    # Account & summoner
+    "account_by_riot_id": ("regional_host", "/riot/account/v1/accounts/by-riot-id/{game_name}/{tag_line}", None),
+    "account_by_puuid": ("regional_host", "/riot/account/v1/accounts/by-puuid/{puuid}", None),
+    "summoner_by_puuid": ("platform_host", "/tft/summoner/v1/summoners/by-puuid/{puuid}", "normal"),
+    "summoner_by_name": ("platform_host", "/tft/summoner/v1/summoners/by-name/{summoner_name}", None),
+    "summoner_by_id": ("platform_host", "/tft/summoner/v1/summoners/{summoner_id}", "normal"),
+    # League / ranked
+    "challenger_league": ("platform_host", "/tft/league/v1/challenger", "normal"),
+    "grandmaster_league": ("platform_host", "/tft/league/v1/grandmaster", "normal"),
+    "master_league": ("platform_host", "/tft/league/v1/master", "normal"),
+    "league_entries_by_summoner": ("platform_host", "/tft/league/v1/entries/by-summoner/{summoner_id}", None),
+    "league_entries_by_puuid": ("platform_host", "/tft/league/v1/by-puuid/{puuid}", None),
+    "league_entries_by_tier": ("platform_host", "/tft/league/v1/entries/{tier}/{division}", None),
+    # Match
+    "match_ids_by_puuid": ("regional_host", "/tft/match/v1/matches/by-puuid/{puuid}/ids", None),
+    "match_details": ("regional_host", "/tft/match/v1/matches/{match_id}", "long"),
+    # Spectator
+    "active_game_by_summoner": ("platform_host", "/tft/spectator/v5/active-games/by-summoner/{summoner_id}", "short"),
+    "featured_games": ("platform_host", "/tft/spectator/v5/featured-games", None),
+    # Status
+    "platform_status": ("platform_host", "/tft/status/v1/platform-data", None),
+}
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of API responses with per-entry expiry.
+    
+    Expired entries are kept until evicted so they can be served as a
+    fallback when the upstream request fails. Bodies are stored serialized
+    and every get() decodes a fresh copy, so callers may annotate the
+    returned object without changing what later hits see.
+    """
+    
+    def __init__(self, maxsize: int = RESPONSE_CACHE_MAXSIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Tuple[Any, bool]:
+        """Return (body, fresh); body is None when the key was never cached."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, False
+            self._entries.move_to_end(key)
+        stale_at, body = entry
+        return loads_json(body), time.monotonic() < stale_at
+    
+    def put(self, key: Hashable, body: Any, ttl: float) -> None:
+        body = dumps_json(body)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, body)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
 
 class RiotAPIEndpoints:
     """
@@ -16,71 +128,121 @@ class RiotAPIEndpoints:
     This class provides organized access to all TFT-related API endpoints.
     """
     
+    _cache_init_lock = threading.Lock()
+    
+    # RESPONSE CACHE
+    
+    @property
+    def response_cache(self) -> ResponseCache:
+        """Per-instance response cache, created on first use"""
+        cache = self.__dict__.get("_response_cache")
+        if cache is None:
+            with self._cache_init_lock:
+                cache = self.__dict__.setdefault("_response_cache", ResponseCache())
+        return cache
+    
+    @property
+    def ddragon_session(self) -> requests.Session:
+        """Pooled session for Data Dragon CDN requests, created on first use"""
+        session = self.__dict__.get("_ddragon_session")
+        if session is None:
+            with self._cache_init_lock:
+                session = self.__dict__.setdefault("_ddragon_session", create_ddragon_session())
+        return session
+    
+    def _cached_request(self, url: str, params: Dict = None, policy: str = "normal",
+                        timeout: Optional[int] = None) -> Optional[Any]:
+        """
+        Make a request through the response cache.
+        
+        Fresh hits skip the API call (and its rate-limit token) entirely. If the
+        upstream request fails, the last stale body for the same request is
+        returned instead of None.
+        """
+        key = (url, tuple(sorted(params.items())) if params else ())
+        cached, fresh = self.response_cache.get(key)
+        if fresh:
+            return cached
+        
+        data = self._make_request(url, params, timeout=timeout)
+        if data is None:
+            if cached is not None:
+                logger.warning(f"Request failed, serving stale cached response: {url}")
+            return cached
+        
+        self.response_cache.put(key, data, CACHE_TTLS[policy])
+        return data
+    
+    def call_endpoint(self, name: str, params: Dict = None, timeout: Optional[int] = None,
+                      **path_args: Any) -> Optional[Any]:
+        """
+        Call a Riot API endpoint from the ENDPOINTS table.
+        
+        Args:
+            name: Endpoint name, e.g. "match_details"
+            params: Optional query parameters
+            timeout: Optional custom timeout in seconds
+            **path_args: Values for the placeholders in the path template
+        """
+        host_attr, path, policy = ENDPOINTS[name]
+        url = f"https://{getattr(self, host_attr)}{path.format_map(path_args)}"
+        if policy is None:
+            return self._make_request(url, params, timeout=timeout)
+        return self._cached_request(url, params, policy=policy, timeout=timeout)
+    
     # ACCOUNT & SUMMONER DATA
     
     def get_account_by_riot_id(self, game_name: str, tag_line: str) -> Optional[Dict]:
         """Get account information by Riot ID"""
-        url = f"https://{self.regional_host}/riot/account/v1/accounts/by-riot-id/{game_name}/{tag_line}"
-        return self._make_request(url)
+        return self.call_endpoint("account_by_riot_id", game_name=game_name, tag_line=tag_line)
     
     def get_account_by_puuid(self, puuid: str) -> Optional[Dict]:
         """Get account information by PUUID"""
-        url = f"https://{self.regional_host}/riot/account/v1/accounts/by-puuid/{puuid}"
-        return self._make_request(url)
+        return self.call_endpoint("account_by_puuid", puuid=puuid)
     
     def get_summoner_by_puuid(self, puuid: str) -> Optional[Dict]:
         """Get summoner information by PUUID"""
-        url = f"https://{self.platform_host}/tft/summoner/v1/summoners/by-puuid/{puuid}"
-        return self._make_request(url)
+        return self.call_endpoint("summoner_by_puuid", puuid=puuid)
     
     def get_summoner_by_name(self, summoner_name: str) -> Optional[Dict]:
         """Get summoner information by name"""
-        url = f"https://{self.platform_host}/tft/summoner/v1/summoners/by-name/{summoner_name}"
-        return self._make_request(url)
+        return self.call_endpoint("summoner_by_name", summoner_name=summoner_name)
     
     def get_summoner_by_id(self, summoner_id: str) -> Optional[Dict]:
         """Get summoner information by summoner ID (encrypted summoner ID)"""
-        url = f"https://{self.platform_host}/tft/summoner/v1/summoners/{summoner_id}"
-        return self._make_request(url)
+        return self.call_endpoint("summoner_by_id", summoner_id=summoner_id)
     
     # LEAGUE/RANKED DATA
     
     def get_challenger_league(self, queue: str = "RANKED_TFT") -> Optional[Dict]:
         """Get challenger league data"""
-        url = f"https://{self.platform_host}/tft/league/v1/challenger"
-        return self._make_request(url, params={"queue": queue})
+        return self.call_endpoint("challenger_league", params={"queue": queue})
     
     def get_grandmaster_league(self, queue: str = "RANKED_TFT") -> Optional[Dict]:
         """Get grandmaster league data"""
-        url = f"https://{self.platform_host}/tft/league/v1/grandmaster"
-        return self._make_request(url, params={"queue": queue})
+        return self.call_endpoint("grandmaster_league", params={"queue": queue})
     
     def get_master_league(self, queue: str = "RANKED_TFT") -> Optional[Dict]:
         """Get master league data"""
-        url = f"https://{self.platform_host}/tft/league/v1/master"
-        return self._make_request(url, params={"queue": queue})
+        return self.call_endpoint("master_league", params={"queue": queue})
     
     def get_league_entries_by_summoner(self, summoner_id: str) -> Optional[List[Dict]]:
         """Get league entries for a summoner"""
-        url = f"https://{self.platform_host}/tft/league/v1/entries/by-summoner/{summoner_id}"
-        return self._make_request(url)
+        return self.call_endpoint("league_entries_by_summoner", summoner_id=summoner_id)
     
     def get_league_entries_by_puuid(self, puuid: str) -> Optional[List[Dict]]:
         """Get league entries in all queues for a given PUUID"""
-        url = f"https://{self.platform_host}/tft/league/v1/by-puuid/{puuid}"
-        return self._make_request(url)
+        return self.call_endpoint("league_entries_by_puuid", puuid=puuid)
     
     def get_league_entries_by_tier(self, tier: str, division: str, page: int = 1) -> Optional[List[Dict]]:
         """Get all league entries for a specific tier and division"""
-        url = f"https://{self.platform_host}/tft/league/v1/entries/{tier}/{division}"
-        return self._make_request(url, params={"page": page})
+        return self.call_endpoint("league_entries_by_tier", params={"page": page}, tier=tier, division=division)
     
     # MATCH DATA
     
     def get_match_ids_by_puuid(self, puuid: str, start: int = 0, count: int = 20, 
                               start_time: Optional[int] = None, end_time: Optional[int] = None) -> Optional[List[str]]:
         """Get match IDs for a player with optional time filtering"""
-        url = f"https://{self.regional_host}/tft/match/v1/matches/by-puuid/{puuid}/ids"
         params = {"start": start, "count": count}
         
         if start_time:
@@ -88,38 +250,34 @@ class RiotAPIEndpoints:
         if end_time:
             params["endTime"] = end_time
             
-        return self._make_request(url, params)
+        return self.call_endpoint("match_ids_by_puuid", params=params, puuid=puuid)
     
     def get_match_details(self, match_id: str) -> Optional[Dict]:
         """Get detailed match information"""
-        url = f"https://{self.regional_host}/tft/match/v1/matches/{match_id}"
-        return self.requester.make_request(url, timeout=60)
+        return self.call_endpoint("match_details", timeout=60, match_id=match_id)
     
     # SPECTATOR DATA
     
     def get_active_game_by_summoner(self, summoner_id: str) -> Optional[Dict]:
         """Get current game information for a summoner"""
-        url = f"https://{self.platform_host}/tft/spectator/v5/active-games/by-summoner/{summoner_id}"
-        return self._make_request(url)
+        return self.call_endpoint("active_game_by_summoner", summoner_id=summoner_id)
     
     def get_featured_games(self) -> Optional[Dict]:
         """Get list of current featured games"""
-        url = f"https://{self.platform_host}/tft/spectator/v5/featured-games"
-        return self._make_request(url)
+        return self.call_endpoint("featured_games")
     
     # STATUS DATA
     
     def get_platform_status(self) -> Optional[Dict]:
         """Get platform status information"""
-        url = f"https://{self.platform_host}/tft/status/v1/platform-data"
-        return self._make_request(url)
+        return self.call_endpoint("platform_status")
     
     # STATIC DATA (DATA DRAGON)
     
     def get_data_dragon_versions(self) -> Optional[List[str]]:
         """Get available Data Dragon versions"""
         url = "https://ddragon.leagueoflegends.com/api/versions.json"
-        response = requests.get(url)
+        response = self.ddragon_session.get(url, timeout=30)
         return response.json() if response.status_code == 200 else None
     
     def get_static_data(self, version: str = None) -> Dict[str, Any]:
@@ -129,30 +287,27 @@ class RiotAPIEndpoints:
             version = versions[0] if versions else "15.15.1"
         
         base_url = f"https://ddragon.leagueoflegends.com/cdn/{version}/data/en_US"
-        static_data = {}
         
-        data_types = [
-            "tft-champion",
-            "tft-item", 
-            "tft-trait",
-            "tft-augments",
-            "tft-tactician",
-            "tft-queues",
-            "tft-regalia",
-            "tft-arena"
-        ]
-        
-        for data_type in data_types:
+        def fetch(data_type: str) -> Optional[Dict]:
             try:
-                url = f"{base_url}/{data_type}.json"
-                response = requests.get(url, timeout=30)
+                response = self.ddragon_session.get(f"{base_url}/{data_type}.json", timeout=30)
                 if response.status_code == 200:
-                    static_data[data_type] = response.json()
                     logger.info(f"Successfully fetched {data_type} data")
-                else:
-                    logger.warning(f"Failed to fetch {data_type}: {response.status_code}")
+                    return response.json()
+                logger.warning(f"Failed to fetch {data_type}: {response.status_code}")
             except Exception as e:
                 logger.error(f"Error fetching {data_type}: {e}")
+            return None
+        
+        # The files are independent, so fetch them concurrently over the pooled
+        # session; wall time is the slowest download, not the sum.
+        with ThreadPoolExecutor(max_workers=len(STATIC_DATA_TYPES)) as executor:
+            results = executor.map(fetch, STATIC_DATA_TYPES)
+            static_data = {
+                data_type: data
+                for data_type, data in zip(STATIC_DATA_TYPES, results)
+                if data is not None
+            }
         
         return static_data
 
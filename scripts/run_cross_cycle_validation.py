@@ -16,6 +16,7 @@ logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
+logger = logging.getLogger(__name__)
 
 import argparse
 
@@ -33,40 +34,42 @@ def main():
     report_path = Path(report_file)
     report_path.parent.mkdir(parents=True, exist_ok=True)
     
-    print(f"Running cross-cycle validation on {output_dir}...")
+    logger.info("Running cross-cycle validation on %s...", output_dir)
     
     try:
         report = run_validation(output_dir, report_file)
         
         if "error" in report:
-            print(f"Error: {report['error']}")
+            logger.error("Error: %s", report['error'])
             return
             
-        print(f"\nValidation Complete!")
-        print(f"Analyzed {report['cycles_analyzed']} cycles from {report['date_range']['start']} to {report['date_range']['end']}")
+        logger.info("Validation Complete!")
+        logger.info("Analyzed %d cycles from %s to %s", report['cycles_analyzed'],
+                    report['date_range']['start'], report['date_range']['end'])
         
-        print("\n--- Continuity Analysis ---")
+        logger.info("--- Continuity Analysis ---")
         if 'continuity_trends' in report['continuity_analysis']:
             for trend in report['continuity_analysis']['continuity_trends']:
-                print(f"Cycle {trend['to_cycle']}: Retained {trend['retained_count']} players ({trend['retention_rate']:.1%}), New: {trend['new_count']}, Churned: {trend['churned_count']}")
+                logger.info("Cycle %s: Retained %d players (%.1f%%), New: %d, Churned: %d",
+                            trend['to_cycle'], trend['retained_count'], trend['retention_rate'] * 100,
+                            trend['new_count'], trend['churned_count'])
         else:
-            print(report['continuity_analysis'].get('status', 'No continuity data'))
+            logger.info("%s", report['continuity_analysis'].get('status', 'No continuity data'))
             
-        print("\n--- Stability Analysis ---")
+        logger.info("--- Stability Analysis ---")
         issues = report['stability_analysis'].get('volume_issues', [])
         if issues:
-            print(f"Found {len(issues)} volume anomalies:")
+            logger.info("Found %d volume anomalies:", len(issues))
             for issue in issues:
-                print(f"  - {issue['metric']} changed by {issue['change_pct']:.1%} in {issue['cycle']}")
+                logger.info("  - %s changed by %.1f%% in %s",
+                            issue['metric'], issue['change_pct'] * 100, issue['cycle'])
         else:
-            print("No volume anomalies detected.")
+            logger.info("No volume anomalies detected.")
             
-        print(f"\nFull report saved to {report_file}")
+        logger.info("Full report saved to %s", report_file)
         
     except Exception as e:
-        print(f"Failed to run validation: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Failed to run validation: %s", e)
 
 if __name__ == "__main__":
     main()
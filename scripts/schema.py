@@ -3,10 +3,14 @@ This module contains the comprehensive JSON-LD schema definitions for TFT data c
 Provides semantic data structure design and RDF compatibility for analysis-ready datasets.
 """
 
-import json
 from typing import Dict, Any
 from datetime import datetime
 
+from scripts.utils import dumps_json
+
+# Built schemas keyed by (base_uri, schema_uri); shared between generators
+_SCHEMA_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
 
 class TFTSchemaGenerator:
     """
@@ -19,6 +23,19 @@ class TFTSchemaGenerator:
         self.schema_uri = f"{self.base_uri}schema#"
         
     def create_comprehensive_schema(self) -> Dict[str, Any]:
+        """
+        Get the complete JSON-LD schema for TFT data structures.
+        
+        The schema is built once per base URI and the same dict is returned on
+        every call, so callers must treat it as read-only.
+        """
+        key = (self.base_uri, self.schema_uri)
+        schema = _SCHEMA_CACHE.get(key)
+        if schema is None:
+            schema = _SCHEMA_CACHE[key] = self._build_comprehensive_schema()
+        return schema
+    
+    def _build_comprehensive_schema(self) -> Dict[str, Any]:
         """
         Create a complete JSON-LD schema for TFT data structures
         """
@@ -196,14 +213,15 @@ class TFTSchemaGenerator:
         """
         schema = self.create_comprehensive_schema()
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(schema, f, indent=2, ensure_ascii=False)
+        with open(filename, 'wb') as f:
+            f.write(dumps_json(schema, indent=True))
         
         print(f"[SUCCESS] JSON-LD schema exported to {filename}")
         
     def get_schema_context(self) -> Dict[str, Any]:
         """
-        Get just the @context portion of the schema for embedding in data
+        Get just the @context portion of the schema for embedding in data.
+        The returned dict is shared; treat it as read-only.
         """
         full_schema = self.create_comprehensive_schema()
         return full_schema["@context"]
@@ -4,17 +4,24 @@ Transforms validated JSON data into JSON-LD format with proper @type annotations
 and semantic context.
 """
 
-import json
+import os
 import sys
 import argparse
 import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
 
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from scripts.schema import TFTSchemaGenerator
+from scripts.utils import atomic_open, dumps_json, loads_json
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 logging.basicConfig(
     level=logging.INFO,
@@ -22,60 +29,129 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def transform_to_jsonld(input_file: Path, output_file: Path) -> None:
+# Inputs at least this large are parsed incrementally when ijson is installed
+STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+Items = Iterable[Tuple[str, Dict[str, Any]]]
+
+PLAYER_URN_PREFIX = "urn:tft:player:"
+MATCH_URN_PREFIX = "urn:tft:match:"
+PARTICIPANT_URN_PREFIX = "urn:tft:participant:"
+
+# Shared, read-only schema context embedded in every output
+_TFT_CONTEXT = TFTSchemaGenerator().get_schema_context()
+
+
+def _stream_items(input_file: Path, prefix: str) -> Items:
+    """Yield the key/value pairs of one top-level object without loading the file."""
+    with open(input_file, 'rb') as f:
+        yield from ijson.kvitems(f, prefix, use_float=True)
+
+
+def _read_collection(input_file: Path) -> Tuple[Dict[str, Any], Items, Items]:
+    """
+    Return (collectionInfo, player items, match items) for an input file.
+    
+    Large files are streamed with ijson so only one player or match is held in
+    memory at a time; everything else is loaded in one go.
+    """
+    if ijson is not None and input_file.stat().st_size >= STREAM_THRESHOLD_BYTES:
+        logger.info(f"Streaming records from {input_file}")
+        with open(input_file, 'rb') as f:
+            collection_info = next(ijson.items(f, 'collectionInfo', use_float=True), {})
+        return (collection_info,
+                _stream_items(input_file, 'players'),
+                _stream_items(input_file, 'matches'))
+    
+    data = loads_json(input_file.read_bytes())
+    logger.info(f"Loaded {len(data) if isinstance(data, list) else 1} records from {input_file}")
+    return (data.get("collectionInfo", {}),
+            data.get("players", {}).items(),
+            data.get("matches", {}).items())
+
+
+def _transform_players(players: Items) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield (puuid, player) pairs annotated in place with JSON-LD @type/@id."""
+    for puuid, player_data in players:
+        player_data["@type"] = "TFTPlayer"
+        player_data["@id"] = PLAYER_URN_PREFIX + puuid
+        yield puuid, player_data
+
+
+def tag_participants(participants: List[Dict[str, Any]], match_id: str) -> None:
+    """Annotate a match's participants in place with @type and, when known, @id."""
+    prefix = PARTICIPANT_URN_PREFIX + match_id + ":"
+    for p in participants:
+        p["@type"] = "TFTParticipant"
+        puuid = p.get("puuid")
+        if puuid is not None:
+            p["@id"] = prefix + puuid
+
+
+def _transform_matches(matches: Items) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield (match_id, match) pairs with the match and its participants annotated in place."""
+    for match_id, match_data in matches:
+        match_data["@type"] = "TFTMatch"
+        match_data["@id"] = MATCH_URN_PREFIX + match_id
+        
+        info = match_data.get("info")
+        if info is not None and "participants" in info:
+            tag_participants(info["participants"], match_id)
+            
+        yield match_id, match_data
+
+
+def _write_members(f: BinaryIO, items: Iterable[Tuple[str, Any]]) -> None:
+    """Write "key":value pairs of a JSON object body, one record at a time."""
+    separator = b""
+    for key, value in items:
+        f.write(separator + dumps_json(key) + b":" + dumps_json(value))
+        separator = b","
+
+
+def _write_lines(f: BinaryIO, items: Iterable[Tuple[str, Any]]) -> None:
+    """Write each record's value as its own JSON line."""
+    for _, value in items:
+        f.write(dumps_json(value) + b"\n")
+
+
+def transform_to_jsonld(input_file: Path, output_file: Path, ndjson: bool = False) -> None:
     """
     Transform validated JSON data to JSON-LD format.
+    
+    Players and matches are transformed and written one record at a time, so no
+    second copy of the collection is built in memory. The output replaces
+    output_file only once every record has been written.
+    
+    Args:
+        input_file: Validated JSON collection
+        output_file: Destination file
+        ndjson: Write newline-delimited JSON instead of a single document: a
+            header line with @context and collectionInfo, then one line per
+            player and one line per match
     """
     try:
-        with open(input_file, 'r') as f:
-            data = json.load(f)
-            
-        logger.info(f"Loaded {len(data) if isinstance(data, list) else 1} records from {input_file}")
-        
-        generator = TFTSchemaGenerator()
-        context = generator.get_schema_context()
+        collection_info, players, matches = _read_collection(input_file)
         
-        jsonld_data = {
-            "@context": context,
-            "@type": "TFTDataCollection",
-            "collectionInfo": data.get("collectionInfo", {}),
-            "players": {},
-            "matches": {}
-        }
+        timestamp = collection_info.get("timestamp", "")
+        region = collection_info.get("extractionLocation", "unknown")
+        collection_info["@id"] = f"urn:tft:collection:{region}:{timestamp}"
         
-        if "collectionInfo" in jsonld_data:
-            timestamp = jsonld_data["collectionInfo"].get("timestamp", "")
-            region = jsonld_data["collectionInfo"].get("extractionLocation", "unknown")
-            jsonld_data["collectionInfo"]["@id"] = f"urn:tft:collection:{region}:{timestamp}"
-        
-        if "players" in data:
-            for puuid, player_data in data["players"].items():
-                transformed_player = player_data.copy()
-                transformed_player["@type"] = "TFTPlayer"
-                transformed_player["@id"] = f"urn:tft:player:{puuid}"
-                jsonld_data["players"][puuid] = transformed_player
-                
-        if "matches" in data:
-            for match_id, match_data in data["matches"].items():
-                transformed_match = match_data.copy()
-                transformed_match["@type"] = "TFTMatch"
-                transformed_match["@id"] = f"urn:tft:match:{match_id}"
-                
-                if "info" in transformed_match and "participants" in transformed_match["info"]:
-                    participants = []
-                    for p in transformed_match["info"]["participants"]:
-                        p_copy = p.copy()
-                        p_copy["@type"] = "TFTParticipant"
-                        if "puuid" in p_copy:
-                            p_copy["@id"] = f"urn:tft:participant:{match_id}:{p_copy['puuid']}"
-                        participants.append(p_copy)
-                    transformed_match["info"]["participants"] = participants
-                    
-                jsonld_data["matches"][match_id] = transformed_match
-                
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_file, 'w') as f:
-            json.dump(jsonld_data, f, indent=2, ensure_ascii=False)
+        with atomic_open(output_file) as f:
+            if ndjson:
+                f.write(dumps_json({"@context": _TFT_CONTEXT, "@type": "TFTDataCollection",
+                                    "collectionInfo": collection_info}) + b"\n")
+                _write_lines(f, _transform_players(players))
+                _write_lines(f, _transform_matches(matches))
+            else:
+                f.write(b'{"@context":' + dumps_json(_TFT_CONTEXT) +
+                        b',"@type":"TFTDataCollection","collectionInfo":' + dumps_json(collection_info) +
+                        b',"players":{')
+                _write_members(f, _transform_players(players))
+                f.write(b'},"matches":{')
+                _write_members(f, _transform_matches(matches))
+                f.write(b'}}')
             
         logger.info(f"Successfully transformed data to JSON-LD at {output_file}")
         
@@ -83,19 +159,72 @@ def transform_to_jsonld(input_file: Path, output_file: Path) -> None:
         logger.error(f"Transformation failed: {e}")
         raise
 
+def transform_directory(input_dir: Path, output_dir: Path, max_workers: Optional[int] = None,
+                        ndjson: bool = False) -> Tuple[List[Path], List[Path]]:
+    """
+    Transform every *.json file in input_dir into a .jsonld (or, with ndjson,
+    .ndjson) file in output_dir.
+    
+    Files are independent and CPU-bound, so they are spread over a process pool.
+    
+    Returns:
+        (written output files, input files that failed)
+    """
+    suffix = ".ndjson" if ndjson else ".jsonld"
+    pairs = [(path, output_dir / path.with_suffix(suffix).name)
+             for path in sorted(input_dir.glob("*.json"))]
+    if not pairs:
+        logger.warning(f"No JSON files found in {input_dir}")
+        return [], []
+    
+    workers = min(max_workers or os.cpu_count() or 1, len(pairs))
+    logger.info(f"Transforming {len(pairs)} files with {workers} workers")
+    
+    written, failed = [], []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(transform_to_jsonld, src, dst, ndjson): (src, dst) for src, dst in pairs}
+        for future in as_completed(futures):
+            src, dst = futures[future]
+            try:
+                future.result()
+                written.append(dst)
+            except Exception as e:
+                logger.error(f"Failed to transform {src}: {e}")
+                failed.append(src)
+    
+    return sorted(written), sorted(failed)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Transform validated JSON to JSON-LD")
-    parser.add_argument("input_file", type=Path, help="Input validated JSON file")
-    parser.add_argument("output_file", type=Path, help="Output JSON-LD file")
+    parser.add_argument("input_file", type=Path, nargs="?", help="Input validated JSON file")
+    parser.add_argument("output_file", type=Path, nargs="?", help="Output JSON-LD file")
+    parser.add_argument("--input-dir", type=Path, help="Transform every *.json file in this directory")
+    parser.add_argument("--output-dir", type=Path, help="Directory for .jsonld outputs (with --input-dir)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--ndjson", action="store_true",
+                        help="Write newline-delimited JSON: a header line, then one line per player and match")
     
     args = parser.parse_args()
     
+    if args.input_dir or args.output_dir:
+        if not (args.input_dir and args.output_dir):
+            parser.error("--input-dir and --output-dir must be given together")
+        if not args.input_dir.is_dir():
+            logger.error(f"Input directory not found: {args.input_dir}")
+            sys.exit(1)
+        _, failed = transform_directory(args.input_dir, args.output_dir, args.workers, args.ndjson)
+        sys.exit(1 if failed else 0)
+    
+    if not (args.input_file and args.output_file):
+        parser.error("input_file and output_file are required without --input-dir")
+    
     if not args.input_file.exists():
         logger.error(f"Input file not found: {args.input_file}")
         sys.exit(1)
         
     try:
-        transform_to_jsonld(args.input_file, args.output_file)
+        transform_to_jsonld(args.input_file, args.output_file, args.ndjson)
     except Exception as e:
         logger.error(f"Error: {e}")
         sys.exit(1)
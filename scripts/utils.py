@@ -5,57 +5,317 @@ and other general-purpose functionality used across the TFT data collection syst
 
 import json
 import logging
-from datetime import datetime
+import mmap
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, BinaryIO, Callable, Iterator, Optional, List, Sequence, Tuple, TypeVar, Union
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional; load_match_summaries falls back to a full load
+    ijson = None
+
+try:
+    import zstandard
+except ImportError:  # optional; only needed for .zst archives
+    zstandard = None
 
 logger = logging.getLogger(__name__)
 
+# Largest slice handed to a single os.write call
+_WRITE_CHUNK = 1 << 20
+
+# Files at least this large are memory-mapped for parsing rather than read
+_MMAP_THRESHOLD = 64 * 1024
+
+# Compression level for .zst archives
+_ZSTD_LEVEL = 3
+
+# Timestamp format for auto-generated save filenames
+_TS_FMT = "%Y%m%d_%H%M%S"
+
+# Parent directories already created (or found) by the save functions
+_CREATED_DIRS: set = set()
+
+_T = TypeVar("_T")
+
 # Known special queue IDs that may have <8 participants
 SPECIAL_QUEUES = {
     1220: "Special queue (practice/tutorial mode)",
     # Add more as discovered
 }
+_SPECIAL_QUEUE_IDS = frozenset(SPECIAL_QUEUES)
+
+# Incomplete-match reasons, formatted once and shared by every flagged match.
+# Short lobbies are indexed by participant count (0-7); special queues by
+# queue ID, then by is_short (False: full lobby, True: short lobby).
+_SHORT_REASONS = tuple(f"Only {count} participants (expected 8)" for count in range(8))
+_SPECIAL_REASONS = {
+    queue_id: (
+        f"Special queue {queue_id}: {name} (unexpected 8 participants)",
+        f"Special queue {queue_id}: {name} (expected <8 participants)",
+    )
+    for queue_id, name in SPECIAL_QUEUES.items()
+}
+
+def dumps_json(data: Any, indent: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON, using orjson when it is installed.
+    
+    Args:
+        data: JSON-serializable object
+        indent: If True, pretty-print with a 2-space indent
+        
+    Returns:
+        Encoded JSON document as bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def loads_json(buf: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document, using orjson when it is installed.
+    
+    Both backends raise json.JSONDecodeError (orjson's error subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+
+def _zstd():
+    """Return the zstandard module, or raise if .zst support is unavailable."""
+    if zstandard is None:
+        raise RuntimeError("zstandard is required for .zst files (pip install zstandard)")
+    return zstandard
+
+
+def _write_all(fd: int, buf: bytes) -> None:
+    """Write buf to a raw file descriptor in _WRITE_CHUNK slices, retrying short writes."""
+    view = memoryview(buf)
+    while view:
+        written = os.write(fd, view[:_WRITE_CHUNK])
+        view = view[written:]
+
+
+def _ensure_dir(directory: Path) -> None:
+    """mkdir -p, skipping directories this process has already ensured."""
+    key = str(directory)
+    if key not in _CREATED_DIRS:
+        directory.mkdir(parents=True, exist_ok=True)
+        _CREATED_DIRS.add(key)
+
+
+def _retry_if_dir_removed(file_path: Path, create_dirs: bool, write: Callable[[], _T]) -> _T:
+    """
+    Run write(), retrying once if the output directory has gone missing.
+    
+    _ensure_dir remembers directories it created, so one removed since would
+    otherwise fail every later save to it; forget it, recreate it and retry.
+    """
+    try:
+        return write()
+    except FileNotFoundError:
+        if not create_dirs:
+            raise
+        _CREATED_DIRS.discard(str(file_path.parent))
+        _ensure_dir(file_path.parent)
+        return write()
+
+
+def _temp_path_for(file_path: Path) -> Path:
+    """Sibling temp path unique to this process and thread, so concurrent saves don't collide."""
+    return file_path.with_name(f"{file_path.name}.tmp.{os.getpid()}.{threading.get_ident()}")
+
+
+def _atomic_write(file_path: Path, buf: bytes) -> None:
+    """
+    Write buf to file_path atomically.
+    
+    The bytes go to a sibling temp file that is fsynced and then renamed over
+    the target, so readers only ever see the old or the complete new file.
+    """
+    tmp_path = _temp_path_for(file_path)
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            _write_all(fd, buf)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+@contextmanager
+def atomic_open(file_path: Path) -> Iterator[BinaryIO]:
+    """
+    Open a binary file whose contents replace file_path only on success.
+    
+    Streaming counterpart of _atomic_write: writes go to a sibling temp file
+    that is fsynced and renamed over the target when the block exits cleanly.
+    """
+    tmp_path = _temp_path_for(file_path)
+    try:
+        with open(tmp_path, 'wb') as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _write_json_object(out: BinaryIO, data: Dict[str, Any]) -> None:
+    """
+    Write data as a compact JSON object, encoding nested dicts entry by entry.
+    
+    The output is identical to dumps_json(data); only one player/match (or
+    other top-level section entry) is encoded in memory at a time.
+    """
+    out.write(b"{")
+    separator = b""
+    for key, value in data.items():
+        if isinstance(value, dict):
+            out.write(separator + dumps_json(str(key)) + b":{")
+            entry_separator = b""
+            for entry_key, entry in value.items():
+                # Encoding a one-item dict keeps key handling identical to dumps_json
+                out.write(entry_separator)
+                out.write(memoryview(dumps_json({entry_key: entry}))[1:-1])
+                entry_separator = b","
+            out.write(b"}")
+        else:
+            out.write(separator)
+            out.write(memoryview(dumps_json({key: value}))[1:-1])
+        separator = b","
+    out.write(b"}")
+
+
+def save_data_stream(data: Dict[str, Any], filename: Optional[Union[str, Path]] = None,
+                     create_dirs: bool = True) -> Optional[Tuple[str, int]]:
+    """
+    Save data dictionary to a compact JSON file without building the whole document.
+    
+    Same output as save_data_to_file(data, filename), but top-level sections
+    such as players and matches are encoded one entry at a time, so peak
+    memory tracks the largest single entry rather than the full JSON text.
+    
+    Args:
+        data: Dictionary to save as JSON
+        filename: Output file path. If None, auto-generates timestamped filename.
+            A name ending in .zst is written zstd-compressed
+        create_dirs: If True, create parent directories if they don't exist
+        
+    Returns:
+        Tuple of (path to saved file, bytes written to disk), or None on error
+    """
+    if not filename:
+        timestamp = time.strftime(_TS_FMT)
+        filename = f"tft_la2_data_{timestamp}.json"
+    
+    file_path = Path(filename)
+    
+    try:
+        if create_dirs:
+            _ensure_dir(file_path.parent)
+        
+        def write() -> int:
+            with atomic_open(file_path) as f:
+                if file_path.suffix == '.zst':
+                    compressor = _zstd().ZstdCompressor(level=_ZSTD_LEVEL)
+                    with compressor.stream_writer(f, closefd=False) as out:
+                        _write_json_object(out, data)
+                else:
+                    _write_json_object(f, data)
+                return f.tell()
+        
+        size = _retry_if_dir_removed(file_path, create_dirs, write)
+        logger.info("Data streamed to %s (%d bytes)", file_path, size)
+        return str(file_path), size
+    except Exception as e:
+        logger.error("Error saving data to %s: %s", file_path, e)
+        return None
 
 
 def save_data_to_file(data: Dict[str, Any], filename: Optional[Union[str, Path]] = None, 
-                      create_dirs: bool = True) -> Optional[str]:
+                      create_dirs: bool = True, pretty: bool = False) -> Optional[str]:
     """
     Save data dictionary to JSON file with automatic timestamping.
     
     Args:
         data: Dictionary to save as JSON
-        filename: Output file path (str or Path). If None, auto-generates timestamped filename
+        filename: Output file path (str or Path). If None, auto-generates timestamped filename.
+            A name ending in .zst (e.g. data.json.zst) is written zstd-compressed
         create_dirs: If True, create parent directories if they don't exist
+        pretty: If True, indent with 2 spaces for human reading; the default
+            compact form is smaller and faster to write and load
         
     Returns:
         Path to saved file as string, or None on error
     """
     if not filename:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime(_TS_FMT)
         filename = f"tft_la2_data_{timestamp}.json"
     
     file_path = Path(filename)
     
     try:
         if create_dirs:
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+            _ensure_dir(file_path.parent)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        logger.info(f"Data saved to {file_path}")
+        buf = dumps_json(data, indent=pretty)
+        if file_path.suffix == '.zst':
+            buf = _zstd().ZstdCompressor(level=_ZSTD_LEVEL, threads=-1).compress(buf)
+        _retry_if_dir_removed(file_path, create_dirs, lambda: _atomic_write(file_path, buf))
+        logger.info("Data saved to %s", file_path)
         return str(file_path)
     except Exception as e:
-        logger.error(f"Error saving data to {file_path}: {e}")
+        logger.error("Error saving data to %s: %s", file_path, e)
         return None
 
 
+def _load_json_file(file_path: Path) -> Any:
+    """Parse an uncompressed JSON file, memory-mapping large files for orjson."""
+    with open(file_path, 'rb') as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+            # orjson parses the mapped pages directly, avoiding a heap copy
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        return loads_json(f.read())
+
+
 def load_data_from_file(filename: Union[str, Path], default: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
     """
     Load data dictionary from JSON file.
     
     Args:
-        filename: Input file path (str or Path)
+        filename: Input file path (str or Path); .zst files are decompressed
         default: Default value to return on error (instead of None)
         
     Returns:
@@ -64,26 +324,52 @@ def load_data_from_file(filename: Union[str, Path], default: Optional[Dict[str,
     file_path = Path(filename)
     
     if not file_path.exists():
-        logger.error(f"File not found: {file_path}")
+        logger.error("File not found: %s", file_path)
         return default
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        logger.info(f"Data loaded from {file_path}")
+        if file_path.suffix == '.zst':
+            # decompressobj also handles frames without a content size (streamed writes)
+            data = loads_json(_zstd().ZstdDecompressor().decompressobj().decompress(file_path.read_bytes()))
+        else:
+            data = _load_json_file(file_path)
+        logger.info("Data loaded from %s", file_path)
         return data
     except json.JSONDecodeError as e:
-        logger.error(f"JSON decode error loading {file_path}: {e}")
+        logger.error("JSON decode error loading %s: %s", file_path, e)
         return default
     except UnicodeDecodeError as e:
-        logger.error(f"Unicode decode error loading {file_path}: {e}")
+        logger.error("Unicode decode error loading %s: %s", file_path, e)
         return default
     except Exception as e:
-        logger.error(f"Error loading data from {file_path}: {e}")
+        logger.error("Error loading data from %s: %s", file_path, e)
         return default
 
 
-def identify_incomplete_matches(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+@dataclass
+class IncompleteMatch:
+    """Incomplete match record; a compact alternative to the per-match dict"""
+    # Declared by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = ('match_id', 'participant_count', 'queue_id', 'game_version', 'reasons')
+    
+    match_id: str
+    participant_count: int
+    queue_id: Optional[int]
+    game_version: Optional[str]
+    reasons: List[str]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dictionary form returned by identify_incomplete_matches"""
+        return {
+            'match_id': self.match_id,
+            'participant_count': self.participant_count,
+            'queue_id': self.queue_id,
+            'game_version': self.game_version,
+            'reasons': self.reasons
+        }
+
+
+def identify_incomplete_matches(data: Dict[str, Any], as_dict: bool = True) -> List[Union[Dict[str, Any], IncompleteMatch]]:
     """
     Identify matches with incomplete participant data.
     
@@ -93,57 +379,289 @@ def identify_incomplete_matches(data: Dict[str, Any]) -> List[Dict[str, Any]]:
     
     Args:
         data: TFT collection data dictionary with 'matches' key
+        as_dict: Return plain dictionaries (default); pass False for
+            IncompleteMatch records, which are several times smaller
         
     Returns:
-        List of incomplete match dictionaries, each containing:
+        List of incomplete matches, each containing:
         - match_id: The match identifier
         - participant_count: Number of participants in the match
         - queue_id: Queue ID of the match
         - game_version: Game version string
         - reasons: List of reasons why the match is considered incomplete
     """
+    # Plain append on purpose: CPython's over-allocation makes it amortized O(1),
+    # and a presized list with a manual cursor measured slower on typical archives.
     incomplete = []
+    incomplete_append = incomplete.append
+    special_ids = _SPECIAL_QUEUE_IDS
+    short_reasons = _SHORT_REASONS
+    special_reasons = _SPECIAL_REASONS
     matches = data.get('matches', {})
     
     for match_id, match_data in matches.items():
-        if 'info' not in match_data:
+        try:
+            info = match_data['info']
+        except KeyError:
             continue
         
-        info = match_data['info']
-        participants = info.get('participants', [])
-        participant_count = len(participants)
-        
-        # Check if match is incomplete
-        is_incomplete = False
-        reasons = []
-        
+        participant_count = len(info.get('participants', ()))
         queue_id = info.get('queueId')
         
-        # Primary check: participant count < 8 (unless it's a known special queue)
-        if participant_count < 8:
-            # Only mark as incomplete if it's not a known special queue
-            if queue_id not in SPECIAL_QUEUES:
-                is_incomplete = True
-                reasons.append(f"Only {participant_count} participants (expected 8)")
-            else:
-                # Special queue with <8 participants is expected
-                is_incomplete = True
-                reasons.append(f"Special queue {queue_id}: {SPECIAL_QUEUES[queue_id]} (expected <8 participants)")
-        
-        # Secondary check: special queue (even if it has 8 participants, mark it for documentation)
-        if queue_id in SPECIAL_QUEUES and participant_count >= 8:
-            # This shouldn't happen, but mark it anyway
-            is_incomplete = True
-            reasons.append(f"Special queue {queue_id}: {SPECIAL_QUEUES[queue_id]} (unexpected 8 participants)")
+        # Short lobbies are incomplete; known special queues are always reported
+        # for documentation, whether short (expected) or full (shouldn't happen).
+        is_short = participant_count < 8
+        is_special = queue_id in special_ids
+        if not (is_short or is_special):
+            continue
+        if is_special:
+            reasons = [special_reasons[queue_id][is_short]]
+        else:
+            reasons = [short_reasons[participant_count]]
         
-        if is_incomplete:
-            incomplete.append({
+        if as_dict:
+            incomplete_append({
                 'match_id': match_id,
                 'participant_count': participant_count,
                 'queue_id': queue_id,
                 'game_version': info.get('gameVersion'),
                 'reasons': reasons
             })
+        else:
+            incomplete_append(IncompleteMatch(match_id, participant_count, queue_id,
+                                              info.get('gameVersion'), reasons))
+    
+    return incomplete
+
+
+def _identify_incomplete_in(source: Union[Dict[str, Any], str, Path]) -> List[Dict[str, Any]]:
+    """Worker for identify_incomplete_matches_many: load paths in-process."""
+    if not isinstance(source, dict):
+        source = load_data_from_file(source, default={})
+    return identify_incomplete_matches(source)
+
+
+def identify_incomplete_matches_many(sources: Sequence[Union[Dict[str, Any], str, Path]],
+                                     max_workers: Optional[int] = None) -> List[List[Dict[str, Any]]]:
+    """
+    Run identify_incomplete_matches over several collections in worker processes.
+    
+    Sources may be data dictionaries or paths to collection files. Paths are
+    loaded inside the workers, so reading and parsing overlap across files and
+    only the (small) results cross the process boundary; prefer them over
+    pre-loaded dicts, which must be pickled to each worker. For a single or
+    small collection the IPC overhead dominates - call
+    identify_incomplete_matches directly.
+    
+    Args:
+        sources: Data dictionaries and/or collection file paths
+        max_workers: Worker process count (default: CPU count)
+        
+    Returns:
+        One list of incomplete matches per source, in input order
+    """
+    if len(sources) < 2:
+        return [_identify_incomplete_in(source) for source in sources]
+    workers = min(max_workers or os.cpu_count() or 1, len(sources))
+    # Batch sources only when there are several per worker; with a fixed
+    # chunksize a handful of sources would all land on one worker
+    chunksize = max(1, len(sources) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_identify_incomplete_in, sources, chunksize=chunksize))
+
+
+def _classify_columns_numpy(queue_arr, count_arr, special_ids):
+    """Return (indices, reason keys) of incomplete matches using array operations."""
+    import numpy as np
+    
+    keys = (count_arr < 8).astype(np.int8) + 2 * np.isin(queue_arr, special_ids).astype(np.int8)
+    flagged = np.flatnonzero(keys)
+    return flagged, keys[flagged]
+
+
+def _classify_columns_loop(queue_arr, count_arr, special_ids, out_idx, out_key):
+    """
+    Single-pass equivalent of _classify_columns_numpy, written for numba.
+    
+    Flagged rows are written into the preallocated out_idx/out_key buffers at a
+    running cursor, so no full-length intermediate masks are built.
+    
+    Returns:
+        Number of flagged rows written
+    """
+    k = 0
+    for i in range(queue_arr.shape[0]):
+        key = 1 if count_arr[i] < 8 else 0
+        queue_id = queue_arr[i]
+        for special_id in special_ids:
+            if queue_id == special_id:
+                key += 2
+                break
+        if key:
+            out_idx[k] = i
+            out_key[k] = key
+            k += 1
+    return k
+
+
+_classify_columns = None
+
+
+def _incomplete_classifier():
+    """Return the column classifier, JIT-compiled with numba when it is installed."""
+    global _classify_columns
+    if _classify_columns is None:
+        try:
+            from numba import njit
+        except ImportError:  # optional accelerator; NumPy is the fallback
+            _classify_columns = _classify_columns_numpy
+        else:
+            import numpy as np
+            kernel = njit(cache=True)(_classify_columns_loop)
+            
+            def classify(queue_arr, count_arr, special_ids):
+                n = queue_arr.shape[0]
+                out_idx = np.empty(n, np.int64)
+                out_key = np.empty(n, np.int8)
+                k = kernel(queue_arr, count_arr, special_ids, out_idx, out_key)
+                return out_idx[:k], out_key[:k]
+            
+            _classify_columns = classify
+    return _classify_columns
+
+
+def identify_incomplete_matches_vec(match_ids: Sequence[str], queue_ids: Sequence[int],
+                                    participant_counts: Sequence[int],
+                                    game_versions: Sequence[Optional[str]]) -> List[Dict[str, Any]]:
+    """
+    Columnar variant of identify_incomplete_matches for bulk filtering.
+    
+    Takes parallel per-match columns (e.g. from a DataFrame or Parquet file)
+    and flags incomplete matches with one vectorized pass over the integer
+    columns; result dicts are built only for flagged matches.
+    
+    Args:
+        match_ids: Match identifiers
+        queue_ids: Integer queue IDs (use -1 for unknown)
+        participant_counts: Number of participants per match
+        game_versions: Game version strings
+        
+    Returns:
+        List of incomplete match dictionaries, in the same format and order as
+        identify_incomplete_matches (an unknown queue is reported as None)
+    """
+    import numpy as np
+    
+    queue_arr = np.ascontiguousarray(queue_ids, dtype=np.int64)
+    count_arr = np.ascontiguousarray(participant_counts, dtype=np.int64)
+    special_ids = np.fromiter(_SPECIAL_QUEUE_IDS, dtype=np.int64)
+    
+    flagged, keys = _incomplete_classifier()(queue_arr, count_arr, special_ids)
+    
+    short_reasons = _SHORT_REASONS
+    special_reasons = _SPECIAL_REASONS
+    incomplete = []
+    for i, key, queue_id, participant_count in zip(flagged.tolist(), keys.tolist(),
+                                                    queue_arr[flagged].tolist(),
+                                                    count_arr[flagged].tolist()):
+        incomplete.append({
+            'match_id': match_ids[i],
+            'participant_count': participant_count,
+            'queue_id': None if queue_id == -1 else queue_id,
+            'game_version': game_versions[i],
+            'reasons': [special_reasons[queue_id][key & 1] if key & 2
+                        else short_reasons[participant_count]]
+        })
     
     return incomplete
 
+
+# Row layout of build_match_index
+MATCH_INDEX_DTYPE = [('match_id', 'O'), ('queue_id', 'i4'), ('count', 'i2'), ('game_version', 'O')]
+
+
+def build_match_index(data: Dict[str, Any]):
+    """
+    Denormalize the per-match fields used for completeness checks in one walk.
+    
+    Consumers that inspect the same collection repeatedly can hold on to the
+    index instead of re-walking every match's nested info dict, and feed its
+    columns straight into identify_incomplete_matches_vec. The index is a
+    snapshot; rebuild it after changing data['matches'].
+    
+    Args:
+        data: TFT collection data dictionary with 'matches' key
+        
+    Returns:
+        NumPy structured array with MATCH_INDEX_DTYPE rows (match_id, queue_id,
+        count, game_version). Matches without 'info' are skipped; a missing
+        queueId is stored as -1.
+    """
+    import numpy as np
+    
+    rows = []
+    rows_append = rows.append
+    for match_id, match_data in data.get('matches', {}).items():
+        try:
+            info = match_data['info']
+        except KeyError:
+            continue
+        queue_id = info.get('queueId')
+        rows_append((match_id, -1 if queue_id is None else queue_id,
+                     len(info.get('participants', ())), info.get('gameVersion')))
+    
+    return np.array(rows, dtype=MATCH_INDEX_DTYPE)
+
+
+def load_match_summaries(filename: Union[str, Path]) -> Iterator[Tuple[str, Optional[int], int, Optional[str]]]:
+    """
+    Stream (match_id, queue_id, participant_count, game_version) per match.
+    
+    With ijson installed, matches are parsed one at a time, so peak memory is a
+    single match rather than the whole archive. Without it, the file is loaded
+    with load_data_from_file. Matches without 'info' are skipped.
+    
+    Args:
+        filename: Collection file path (str or Path)
+        
+    Yields:
+        One summary tuple per match, in file order
+    """
+    def summarize(matches):
+        for match_id, match_data in matches:
+            try:
+                info = match_data['info']
+            except KeyError:
+                continue
+            yield (match_id, info.get('queueId'), len(info.get('participants', ())),
+                   info.get('gameVersion'))
+    
+    file_path = Path(filename)
+    
+    if ijson is None:
+        data = load_data_from_file(file_path, default={})
+        yield from summarize(data.get('matches', {}).items())
+        return
+    
+    with open(file_path, 'rb') as f:
+        if file_path.suffix == '.zst':
+            with _zstd().ZstdDecompressor().stream_reader(f) as reader:
+                yield from summarize(ijson.kvitems(reader, 'matches', use_float=True))
+        else:
+            yield from summarize(ijson.kvitems(f, 'matches', use_float=True))
+
+
+def load_match_index(filename: Union[str, Path]):
+    """
+    Build the build_match_index array for a file without loading the whole archive.
+    
+    Returns:
+        NumPy structured array with MATCH_INDEX_DTYPE rows
+    """
+    import numpy as np
+    
+    return np.fromiter(
+        ((match_id, -1 if queue_id is None else queue_id, count, game_version)
+         for match_id, queue_id, count, game_version in load_match_summaries(filename)),
+        dtype=MATCH_INDEX_DTYPE,
+    )
@@ -2,28 +2,42 @@
 This package contains comprehensive end-to-end pipeline testing tools for TFT data collection.
 """
 
-from .end_to_end_pipeline import (
-    run_complete_pipeline_test,
-    run_pipeline_validation_test,
-    create_pipeline_test_report,
-    EndToEndPipelineTester
-)
-from .pipeline_validator import (
-    validate_collection_pipeline,
-    validate_data_integrity_pipeline,
-    validate_output_formats,
-    PipelineValidator
-)
-from .test_runner import (
-    PipelineTestRunner,
-    run_all_pipeline_tests,
-    generate_test_summary
-)
-from .visualization_tester import (
-    create_player_match_visualization,
-    run_visualization_pipeline_test,
-    validate_chart_generation
-)
+import importlib
+
+# Public names and the submodule that defines each. Submodules are imported on
+# first attribute access (PEP 562), so using one tool doesn't load the others
+# and their heavy dependencies (e.g. matplotlib for visualization).
+_LAZY = {
+    'run_complete_pipeline_test': '.end_to_end_pipeline',
+    'run_pipeline_validation_test': '.end_to_end_pipeline',
+    'create_pipeline_test_report': '.end_to_end_pipeline',
+    'EndToEndPipelineTester': '.end_to_end_pipeline',
+    'validate_collection_pipeline': '.pipeline_validator',
+    'validate_data_integrity_pipeline': '.pipeline_validator',
+    'validate_output_formats': '.pipeline_validator',
+    'clear_validation_cache': '.pipeline_validator',
+    'PipelineValidator': '.pipeline_validator',
+    'PipelineTestRunner': '.test_runner',
+    'run_all_pipeline_tests': '.test_runner',
+    'generate_test_summary': '.test_runner',
+    'create_player_match_visualization': '.visualization_tester',
+    'run_visualization_pipeline_test': '.visualization_tester',
+    'validate_chart_generation': '.visualization_tester',
+}
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
 __all__ = [
     'run_complete_pipeline_test',
@@ -33,6 +47,7 @@ __all__ = [
     'validate_collection_pipeline',
     'validate_data_integrity_pipeline',
     'validate_output_formats',
+    'clear_validation_cache',
     'PipelineValidator',
     'PipelineTestRunner',
     'run_all_pipeline_tests',
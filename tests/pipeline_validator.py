@@ -5,23 +5,157 @@ Pipeline Validator Module
 Validation utilities for pipeline components and data integrity testing.
 """
 
+import functools
 import json
 import logging
-from typing import Dict, Any, List, Optional, Tuple, Union
-from datetime import datetime, timedelta
+import threading
+import time
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
+from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-# Import quality assurance modules
-from quality_assurance import (
-    validate_tft_data_structure,
-    validate_jsonld_compliance,
-    detect_statistical_anomalies,
-    calculate_data_quality_score,
-    detect_missing_fields
-)
+# quality_assurance (and NumPy with it) is imported inside the methods that
+# use it, so importing this module stays cheap for callers that never do
 
 logger = logging.getLogger(__name__)
 
+# Memoized component validations kept per validator. Entries hold a reference
+# to their data (so its id can't be reused while cached), which keeps the
+# bound small.
+_QA_CACHE_SIZE = 16
+
+# Top-level components validate_complete_pipeline expects by default
+_DEFAULT_COMPONENTS = ("collectionInfo", "players", "matches", "@context", "@type")
+
+# (component, score key, weight) for the overall pipeline health score
+_COMPONENT_WEIGHTS = (
+    ("structure", "structure_score", 0.25),
+    ("collection", "collection_score", 0.20),
+    ("quality", "quality_score", 0.35),
+    ("formats", "format_score", 0.20),
+)
+
+# (validity flag, label) pairs reported as critical issues when a flag is False
+_FLAGS = (
+    ("structure_valid", "Structure"),
+    ("collection_valid", "Collection"),
+    ("quality_valid", "Quality"),
+    ("formats_valid", "Format"),
+)
+
+# Health-score bands: score >= _STATUS_CUTS[i - 1] falls in band i, which
+# picks both the overall status and the headline recommendation
+_STATUS_CUTS = (60, 70, 80, 90)
+_STATUS_LABELS = ("CRITICAL", "POOR", "ACCEPTABLE", "GOOD", "EXCELLENT")
+_RECOMMENDATIONS = (
+    "🚨 Pipeline is in critical condition and needs comprehensive fixes",
+    "❌ Pipeline has significant issues requiring immediate attention",
+    "⚠️ Pipeline is acceptable but needs attention to quality issues",
+    "✅ Pipeline is performing well with minor improvements needed",
+    "🎉 Pipeline is performing excellently",
+)
+
+# Last report timestamp as [epoch second, formatted]; see _now_iso
+_ts_cache = [None, ""]
+
+# Marks an absent key, so a component stored as None still counts as present
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_iso(timestamp: str) -> datetime:
+    """Parse an ISO 8601 timestamp, reading a trailing 'Z' as UTC"""
+    if timestamp.endswith('Z'):
+        return datetime.fromisoformat(timestamp[:-1]).replace(tzinfo=timezone.utc)
+    return datetime.fromisoformat(timestamp)
+
+
+def _cached_on_data(method):
+    """
+    Memoize a PipelineValidator._validate_* method per data object.
+    
+    Hits require the same object with the same top-level keys; validating a
+    dict that has been modified in place needs clear_cache() first. Data the
+    guard cannot be built for (unsized or unhashable) skips the cache, so
+    the method's own error handling still applies.
+    """
+    @functools.wraps(method)
+    def wrapper(self, data, *args):
+        try:
+            guard = (len(data), frozenset(data))
+        except TypeError:
+            return method(self, data, *args)
+        key = (method.__name__, id(data)) + tuple(tuple(a) if isinstance(a, list) else a for a in args)
+        
+        with self._qa_lock:
+            entry = self._qa_cache.get(key)
+            if entry is not None and entry[0] is data and entry[1] == guard:
+                self._qa_cache.move_to_end(key)
+                return entry[2]
+        
+        # Computed outside the lock; concurrent misses on the same data may
+        # both compute, and the later result simply replaces the earlier one
+        result = method(self, data, *args)
+        with self._qa_lock:
+            self._qa_cache[key] = (data, guard, result)
+            if len(self._qa_cache) > _QA_CACHE_SIZE:
+                self._qa_cache.popitem(last=False)
+        return result
+    return wrapper
+
+
+def _safe_len(value: Any) -> Optional[int]:
+    """
+    Size of a component value without consuming it.
+    
+    One-shot iterators (e.g. a generator of matches) give None, since their
+    length is unknown; other unsized values give 0.
+    """
+    try:
+        return len(value)
+    except TypeError:
+        return None if isinstance(value, Iterator) else 0
+
+
+def _now_iso() -> str:
+    """
+    Local time as ISO 8601 at one-second resolution.
+    
+    The string is formatted once per wall-clock second and reused, so batch
+    validations don't each build and format a fresh datetime.
+    """
+    second = int(time.time())
+    if second != _ts_cache[0]:
+        _ts_cache[:] = [second, datetime.fromtimestamp(second).isoformat()]
+    return _ts_cache[1]
+
+
+@dataclass
+class PipelineReport:
+    """Complete pipeline validation report; an attribute-access alternative to the report dict"""
+    timestamp: str
+    overall_validation_status: str = "RUNNING"
+    component_validations: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    pipeline_health_score: float = 0.0
+    critical_issues: List[str] = field(default_factory=list)
+    recommendations: List[str] = field(default_factory=list)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dictionary form returned by validate_complete_pipeline"""
+        return {
+            "timestamp": self.timestamp,
+            "overall_validation_status": self.overall_validation_status,
+            "component_validations": self.component_validations,
+            "pipeline_health_score": self.pipeline_health_score,
+            "critical_issues": self.critical_issues,
+            "recommendations": self.recommendations
+        }
+
+
 class PipelineValidator:
     """
     Comprehensive pipeline validation framework
@@ -30,83 +164,74 @@ class PipelineValidator:
     def __init__(self):
         """Initialize pipeline validator"""
         self.validation_results = {}
+        self._qa_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._qa_lock = threading.Lock()
         logger.info("Pipeline validator initialized")
     
+    def clear_cache(self) -> None:
+        """Drop memoized component validations"""
+        with self._qa_lock:
+            self._qa_cache.clear()
+    
     def validate_complete_pipeline(self, data: Dict[str, Any], 
-                                 expected_components: List[str] = None) -> Dict[str, Any]:
+                                 expected_components: Sequence[str] = None,
+                                 as_dict: bool = True) -> Union[Dict[str, Any], PipelineReport]:
         """
         Validate complete pipeline execution results
         
         Args:
             data: Pipeline output data to validate
             expected_components: List of expected data components
+            as_dict: Return a plain dictionary (default); pass False for the
+                PipelineReport record
             
         Returns:
-            dict: Complete validation results
+            dict: Complete validation results (PipelineReport if as_dict=False)
         """
-        validation_report = {
-            "timestamp": datetime.now().isoformat(),
-            "overall_validation_status": "RUNNING",
-            "component_validations": {},
-            "pipeline_health_score": 0.0,
-            "critical_issues": [],
-            "recommendations": []
-        }
+        validation_report = PipelineReport(timestamp=_now_iso())
+        component_validations = validation_report.component_validations
         
         try:
             # Default expected components
             if expected_components is None:
-                expected_components = ["collectionInfo", "players", "matches", "@context", "@type"]
+                expected_components = _DEFAULT_COMPONENTS
             
             # Validate data structure
-            structure_validation = self._validate_pipeline_structure(data, expected_components)
-            validation_report["component_validations"]["structure"] = structure_validation
+            component_validations["structure"] = self._validate_pipeline_structure(data, expected_components)
             
             # Validate collection process
-            collection_validation = self._validate_collection_process(data)
-            validation_report["component_validations"]["collection"] = collection_validation
+            component_validations["collection"] = self._validate_collection_process(data)
             
             # Validate data quality
-            quality_validation = self._validate_pipeline_quality(data)
-            validation_report["component_validations"]["quality"] = quality_validation
+            component_validations["quality"] = self._validate_pipeline_quality(data)
             
             # Validate output formats
-            format_validation = self._validate_output_formats(data)
-            validation_report["component_validations"]["formats"] = format_validation
+            component_validations["formats"] = self._validate_output_formats(data)
             
             # Calculate overall health score
-            validation_report["pipeline_health_score"] = self._calculate_pipeline_health_score(
-                validation_report["component_validations"]
-            )
+            validation_report.pipeline_health_score = self._calculate_pipeline_health_score(component_validations)
             
             # Determine overall status
-            if validation_report["pipeline_health_score"] >= 90:
-                validation_report["overall_validation_status"] = "EXCELLENT"
-            elif validation_report["pipeline_health_score"] >= 80:
-                validation_report["overall_validation_status"] = "GOOD"
-            elif validation_report["pipeline_health_score"] >= 70:
-                validation_report["overall_validation_status"] = "ACCEPTABLE"
-            elif validation_report["pipeline_health_score"] >= 60:
-                validation_report["overall_validation_status"] = "POOR"
-            else:
-                validation_report["overall_validation_status"] = "CRITICAL"
+            band = bisect_right(_STATUS_CUTS, validation_report.pipeline_health_score)
+            validation_report.overall_validation_status = _STATUS_LABELS[band]
             
             # Collect critical issues and recommendations
-            validation_report = self._collect_issues_and_recommendations(validation_report)
-            
-            logger.info(f"Pipeline validation complete: {validation_report['overall_validation_status']} "
-                       f"(Score: {validation_report['pipeline_health_score']:.1f})")
+            self._collect_issues_and_recommendations(validation_report)
             
-            return validation_report
+            # %-style args: formatted only if the record is actually emitted
+            logger.info("Pipeline validation complete: %s (Score: %.1f)",
+                        validation_report.overall_validation_status, validation_report.pipeline_health_score)
             
         except Exception as e:
-            validation_report["overall_validation_status"] = "FAILED"
-            validation_report["critical_issues"].append(f"Validation error: {str(e)}")
-            logger.error(f"❌ Pipeline validation failed: {e}")
-            return validation_report
+            validation_report.overall_validation_status = "FAILED"
+            validation_report.critical_issues.append(f"Validation error: {str(e)}")
+            logger.error("❌ Pipeline validation failed: %s", e)
+        
+        return validation_report.to_dict() if as_dict else validation_report
     
+    @_cached_on_data
     def _validate_pipeline_structure(self, data: Dict[str, Any], 
-                                   expected_components: List[str]) -> Dict[str, Any]:
+                                   expected_components: Sequence[str]) -> Dict[str, Any]:
         """Validate pipeline data structure"""
         structure_validation = {
             "structure_valid": False,
@@ -118,26 +243,30 @@ class PipelineValidator:
         
         try:
             # Check for expected components
-            present_components = list(data.keys())
+            expected_set = frozenset(expected_components)
             
+            component_analysis = structure_validation["component_analysis"]
             for component in expected_components:
-                is_present = component in data
-                structure_validation["component_analysis"][component] = {
-                    "present": is_present,
-                    "type": type(data.get(component)).__name__ if is_present else "missing",
-                    "size": len(data[component]) if is_present and hasattr(data[component], '__len__') else 0
-                }
-                
-                if not is_present:
+                value = data.get(component, _MISSING)
+                if value is _MISSING:
+                    component_analysis[component] = {"present": False, "type": "missing", "size": 0}
                     structure_validation["missing_components"].append(component)
+                    continue
+                
+                component_analysis[component] = {
+                    "present": True,
+                    "type": type(value).__name__,
+                    "size": _safe_len(value)
+                }
             
-            # Check for unexpected components
-            for component in present_components:
-                if component not in expected_components:
-                    structure_validation["unexpected_components"].append(component)
+            # Check for unexpected components: the set difference runs in C, and
+            # the list keeps data's key order
+            unexpected = data.keys() - expected_set
+            if unexpected:
+                structure_validation["unexpected_components"] = [c for c in data if c in unexpected]
             
             # Calculate structure score
-            present_count = len([c for c in expected_components if c in data])
+            present_count = len(expected_components) - len(structure_validation["missing_components"])
             structure_validation["structure_score"] = (present_count / len(expected_components)) * 100
             
             # Determine validity
@@ -149,6 +278,7 @@ class PipelineValidator:
             structure_validation["error"] = str(e)
             return structure_validation
     
+    @_cached_on_data
     def _validate_collection_process(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate data collection process metadata"""
         collection_validation = {
@@ -165,27 +295,30 @@ class PipelineValidator:
             required_metadata = ["timestamp", "extractionLocation", "dataVersion"]
             metadata_score = 0
             
+            metadata_analysis = collection_validation["metadata_analysis"]
             for field in required_metadata:
-                is_present = field in collection_info
-                collection_validation["metadata_analysis"][field] = {
+                value = collection_info.get(field, _MISSING)
+                is_present = value is not _MISSING
+                metadata_analysis[field] = {
                     "present": is_present,
-                    "value": collection_info.get(field, "missing")
+                    "value": value if is_present else "missing"
                 }
-                if is_present:
-                    metadata_score += 1
+                metadata_score += is_present
             
             # Validate timing information
-            if "extractionTimestamp" in data and "extractionCompletedTimestamp" in data:
+            start_raw = data.get("extractionTimestamp", _MISSING)
+            end_raw = data.get("extractionCompletedTimestamp", _MISSING)
+            if start_raw is not _MISSING and end_raw is not _MISSING:
                 try:
-                    start_time = datetime.fromisoformat(data["extractionTimestamp"].replace('Z', '+00:00'))
-                    end_time = datetime.fromisoformat(data["extractionCompletedTimestamp"].replace('Z', '+00:00'))
+                    start_time = _parse_iso(start_raw)
+                    end_time = _parse_iso(end_raw)
                     duration = (end_time - start_time).total_seconds()
                     
                     collection_validation["timing_analysis"] = {
                         "has_timing_data": True,
                         "collection_duration_seconds": duration,
-                        "start_time": data["extractionTimestamp"],
-                        "end_time": data["extractionCompletedTimestamp"],
+                        "start_time": start_raw,
+                        "end_time": end_raw,
                         "timing_reasonable": 0 < duration < 3600  # Between 0 and 1 hour
                     }
                 except Exception as e:
@@ -206,6 +339,7 @@ class PipelineValidator:
             collection_validation["error"] = str(e)
             return collection_validation
     
+    @_cached_on_data
     def _validate_pipeline_quality(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate data quality using quality assurance modules"""
         quality_validation = {
@@ -216,15 +350,26 @@ class PipelineValidator:
             "quality_score": 0.0
         }
         
+        from quality_assurance import (
+            calculate_data_quality_score,
+            detect_statistical_anomalies,
+            detect_missing_fields
+        )
+        
         try:
             # Use quality assurance framework
             quality_report = calculate_data_quality_score(data)
             quality_validation["quality_metrics"] = quality_report
             
-            # Anomaly detection
+            # Anomaly detection; the detector flattens matches into NumPy
+            # columns (MatchColumns) itself, inside its own error handling,
+            # so malformed matches still come back as an analysis_error entry.
+            # Without matches there is nothing to penalise.
+            anomaly_count = 0
             if "matches" in data:
                 anomaly_report = detect_statistical_anomalies(data["matches"])
                 quality_validation["anomaly_analysis"] = anomaly_report
+                anomaly_count = len(anomaly_report.get("anomalies_detected", []))
             
             # Field completeness analysis
             field_report = detect_missing_fields(data)
@@ -232,7 +377,7 @@ class PipelineValidator:
             
             # Calculate overall quality score
             base_quality_score = quality_report.get("overall_score", 0)
-            anomaly_penalty = len(anomaly_report.get("anomalies_detected", [])) * 5  # 5 points per anomaly
+            anomaly_penalty = anomaly_count * 5  # 5 points per anomaly
             completeness_bonus = (100 - len(field_report.get("missing_fields", []))) / 100 * 10  # Up to 10 bonus points
             
             quality_validation["quality_score"] = max(0, min(100, base_quality_score - anomaly_penalty + completeness_bonus))
@@ -245,6 +390,7 @@ class PipelineValidator:
             quality_validation["error"] = str(e)
             return quality_validation
     
+    @_cached_on_data
     def _validate_output_formats(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate output formats and JSON-LD compliance"""
         format_validation = {
@@ -254,6 +400,8 @@ class PipelineValidator:
             "format_score": 0.0
         }
         
+        from quality_assurance import validate_jsonld_compliance, validate_tft_data_structure
+        
         try:
             # JSON-LD compliance
             jsonld_compliant, jsonld_issues = validate_jsonld_compliance(data)
@@ -286,112 +434,98 @@ class PipelineValidator:
     
     def _calculate_pipeline_health_score(self, component_validations: Dict[str, Any]) -> float:
         """Calculate overall pipeline health score"""
-        try:
-            # Weight different components
-            weights = {
-                "structure": 0.25,
-                "collection": 0.20,
-                "quality": 0.35,
-                "formats": 0.20
-            }
-            
-            total_score = 0.0
-            total_weight = 0.0
-            
-            for component, weight in weights.items():
-                if component in component_validations:
-                    component_data = component_validations[component]
-                    
-                    # Get component score
-                    if "structure_score" in component_data:
-                        score = component_data["structure_score"]
-                    elif "collection_score" in component_data:
-                        score = component_data["collection_score"]
-                    elif "quality_score" in component_data:
-                        score = component_data["quality_score"]
-                    elif "format_score" in component_data:
-                        score = component_data["format_score"]
-                    else:
-                        score = 0.0
-                    
-                    total_score += score * weight
-                    total_weight += weight
-            
-            return total_score / total_weight if total_weight > 0 else 0.0
-            
-        except Exception as e:
-            logger.error(f"Error calculating pipeline health score: {e}")
-            return 0.0
+        total_score = 0.0
+        total_weight = 0.0
+        
+        # Each component reports its score under its own key
+        for component, score_key, weight in _COMPONENT_WEIGHTS:
+            component_data = component_validations.get(component)
+            if component_data is not None:
+                total_score += component_data.get(score_key, 0.0) * weight
+                total_weight += weight
+        
+        return total_score / total_weight if total_weight > 0 else 0.0
     
-    def _collect_issues_and_recommendations(self, validation_report: Dict[str, Any]) -> Dict[str, Any]:
+    def _collect_issues_and_recommendations(self, validation_report: PipelineReport) -> PipelineReport:
         """Collect critical issues and recommendations from all validations"""
-        try:
-            for component, validation_data in validation_report["component_validations"].items():
-                # Collect critical issues
-                if not validation_data.get("structure_valid", True):
-                    validation_report["critical_issues"].append(f"Structure validation failed for {component}")
-                
-                if not validation_data.get("collection_valid", True):
-                    validation_report["critical_issues"].append(f"Collection validation failed for {component}")
-                
-                if not validation_data.get("quality_valid", True):
-                    validation_report["critical_issues"].append(f"Quality validation failed for {component}")
-                
-                if not validation_data.get("formats_valid", True):
-                    validation_report["critical_issues"].append(f"Format validation failed for {component}")
-                
-                # Collect errors
-                if "error" in validation_data:
-                    validation_report["critical_issues"].append(f"Validation error in {component}: {validation_data['error']}")
-            
-            # Generate recommendations
-            health_score = validation_report["pipeline_health_score"]
-            
-            if health_score >= 90:
-                validation_report["recommendations"].append("🎉 Pipeline is performing excellently")
-            elif health_score >= 80:
-                validation_report["recommendations"].append("✅ Pipeline is performing well with minor improvements needed")
-            elif health_score >= 70:
-                validation_report["recommendations"].append("⚠️ Pipeline is acceptable but needs attention to quality issues")
-            elif health_score >= 60:
-                validation_report["recommendations"].append("❌ Pipeline has significant issues requiring immediate attention")
-            else:
-                validation_report["recommendations"].append("🚨 Pipeline is in critical condition and needs comprehensive fixes")
-            
-            return validation_report
-            
-        except Exception as e:
-            logger.error(f"Error collecting issues and recommendations: {e}")
-            return validation_report
+        critical_issues = validation_report.critical_issues
+        for component, validation_data in validation_report.component_validations.items():
+            # Collect critical issues
+            failed = [label for key, label in _FLAGS if not validation_data.get(key, True)]
+            if failed:
+                critical_issues.extend(f"{label} validation failed for {component}" for label in failed)
+            
+            # Collect errors
+            if "error" in validation_data:
+                critical_issues.append(f"Validation error in {component}: {validation_data['error']}")
+        
+        # Generate recommendations
+        band = bisect_right(_STATUS_CUTS, validation_report.pipeline_health_score)
+        validation_report.recommendations.append(_RECOMMENDATIONS[band])
+        
+        return validation_report
+
+
+_SHARED_VALIDATOR: Optional[PipelineValidator] = None
+
+
+def _shared() -> PipelineValidator:
+    """Validator reused by the convenience functions"""
+    global _SHARED_VALIDATOR
+    if _SHARED_VALIDATOR is None:
+        _SHARED_VALIDATOR = PipelineValidator()
+    return _SHARED_VALIDATOR
+
+
+def _run_check(name: str, data: Any, *args: Any, cache: bool = False) -> Dict[str, Any]:
+    """
+    Run a PipelineValidator._validate_* method on the shared validator.
+    
+    Without cache, the method's memo is bypassed so every call validates
+    data as it is now.
+    """
+    validator = _shared()
+    method = getattr(validator, name)
+    if cache:
+        return method(data, *args)
+    return method.__wrapped__(validator, data, *args)
+
+
+def clear_validation_cache() -> None:
+    """Drop results memoized by convenience calls made with cache=True"""
+    _shared().clear_cache()
 
 
-def validate_collection_pipeline(data: Dict[str, Any]) -> Dict[str, Any]:
+def validate_collection_pipeline(data: Dict[str, Any], cache: bool = False) -> Dict[str, Any]:
     """
     Convenience function to validate data collection pipeline
     
     Args:
         data: Collected data to validate
+        cache: Reuse the result of an earlier cache=True call on the same
+            data object; call clear_validation_cache() after modifying it
         
     Returns:
         dict: Collection validation results
     """
-    validator = PipelineValidator()
-    return validator._validate_collection_process(data)
+    return _run_check("_validate_collection_process", data, cache=cache)
 
 
-def validate_data_integrity_pipeline(data: Dict[str, Any]) -> Dict[str, Any]:
+def validate_data_integrity_pipeline(data: Dict[str, Any], cache: bool = False) -> Dict[str, Any]:
     """
     Convenience function to validate data integrity
     
     Args:
         data: Data to validate for integrity
+        cache: Reuse the results of an earlier cache=True call on the same
+            data object; call clear_validation_cache() after modifying it
         
     Returns:
         dict: Data integrity validation results
     """
-    validator = PipelineValidator()
-    quality_validation = validator._validate_pipeline_quality(data)
-    structure_validation = validator._validate_pipeline_structure(data, ["collectionInfo", "players", "matches"])
+    quality_validation = _run_check("_validate_pipeline_quality", data, cache=cache)
+    structure_validation = _run_check("_validate_pipeline_structure", data,
+                                      ["collectionInfo", "players", "matches"], cache=cache)
     
     return {
         "quality_validation": quality_validation,
@@ -401,18 +535,19 @@ def validate_data_integrity_pipeline(data: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def validate_output_formats(data: Dict[str, Any]) -> Dict[str, Any]:
+def validate_output_formats(data: Dict[str, Any], cache: bool = False) -> Dict[str, Any]:
     """
     Convenience function to validate output formats
     
     Args:
         data: Data to validate formats for
+        cache: Reuse the result of an earlier cache=True call on the same
+            data object; call clear_validation_cache() after modifying it
         
     Returns:
         dict: Format validation results
     """
-    validator = PipelineValidator()
-    return validator._validate_output_formats(data)
+    return _run_check("_validate_output_formats", data, cache=cache)
 
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ Test and demonstration script for the Configuration Manager
 This script demonstrates all major features of the configuration management system.
 """
 
+import functools
 import sys
 from pathlib import Path
 
@@ -13,6 +14,11 @@ sys.path.insert(0, str(Path(__file__).parent))
 from scripts.config_manager import create_config_manager, CollectionPeriod
 import json
 
+# Read-only tests share one loaded configuration instead of re-reading the
+# config file each time; test_cli_overrides mutates its config, so it builds
+# its own.
+_get_cfg = functools.lru_cache(maxsize=1)(create_config_manager)
+
 
 def print_section(title):
     """Print a formatted section header"""
@@ -21,11 +27,17 @@ def print_section(title):
     print(f"{'=' * 70}\n")
 
 
+def write_lines(lines):
+    """Print lines with a single stdout write"""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
 def test_basic_loading():
     """Test basic configuration loading"""
     print_section("1. Basic Configuration Loading")
     
-    config = create_config_manager()
+    config = _get_cfg()
     print(f"✓ Configuration loaded successfully")
     print(f"  Config file: {config.config_file}")
     print(f"  API region: {config.get_api_config()['region']}")
@@ -35,26 +47,28 @@ def test_period_configs():
     """Test loading configuration for each period"""
     print_section("2. Collection Period Configurations")
     
-    config = create_config_manager()
+    config = _get_cfg()
     
+    lines = []
     for period in ["daily", "weekly", "monthly"]:
         period_config = config.get_period_config(period)
         if period_config:
-            print(f"\n{period.upper()}:")
-            print(f"  Enabled: {period_config.enabled}")
-            print(f"  Schedule: {period_config.schedule}")
-            print(f"  Max Players: {period_config.parameters.get('max_players', 'N/A')}")
-            print(f"  Regions: {period_config.parameters.get('regions', ['default'])}")
-            print(f"  Timeout: {period_config.collection_config.get('timeout', 'N/A')}s")
-            print(f"  Retention: {period_config.preservation.get('retention', 'N/A')}")
-            print(f"  Backup: {period_config.preservation.get('backup', 'N/A')}")
+            lines.append(f"\n{period.upper()}:")
+            lines.append(f"  Enabled: {period_config.enabled}")
+            lines.append(f"  Schedule: {period_config.schedule}")
+            lines.append(f"  Max Players: {period_config.parameters.get('max_players', 'N/A')}")
+            lines.append(f"  Regions: {period_config.parameters.get('regions', ['default'])}")
+            lines.append(f"  Timeout: {period_config.collection_config.get('timeout', 'N/A')}s")
+            lines.append(f"  Retention: {period_config.preservation.get('retention', 'N/A')}")
+            lines.append(f"  Backup: {period_config.preservation.get('backup', 'N/A')}")
+    write_lines(lines)
 
 
 def test_get_parameters():
     """Test getting specific parameters"""
     print_section("3. Getting Specific Parameters")
     
-    config = create_config_manager()
+    config = _get_cfg()
     
     period = "weekly"
     params_to_fetch = [
@@ -67,17 +81,18 @@ def test_get_parameters():
         "validation.min_matches",
     ]
     
-    print(f"Parameters for {period.upper()} collection:\n")
+    lines = [f"Parameters for {period.upper()} collection:\n"]
     for param_path in params_to_fetch:
         value = config.get_parameter(period, param_path, "NOT FOUND")
-        print(f"  {param_path}: {value}")
+        lines.append(f"  {param_path}: {value}")
+    write_lines(lines)
 
 
 def test_export_config():
     """Test exporting period configuration"""
     print_section("4. Exporting Period Configuration as Dictionary")
     
-    config = create_config_manager()
+    config = _get_cfg()
     
     period_dict = config.export_period_config_dict("weekly")
     print(f"Weekly configuration export:\n")
@@ -88,7 +103,7 @@ def test_active_periods():
     """Test getting active periods"""
     print_section("5. Active Collection Periods")
     
-    config = create_config_manager()
+    config = _get_cfg()
     active = config.get_active_periods()
     
     print(f"Active periods: {active}")
@@ -100,12 +115,14 @@ def test_regions():
     """Test getting enabled regions for each period"""
     print_section("6. Enabled Regions by Period")
     
-    config = create_config_manager()
+    config = _get_cfg()
     
+    lines = []
     for period in ["daily", "weekly", "monthly"]:
         regions = config.get_enabled_regions(period)
         if regions:
-            print(f"{period.upper()}: {regions}")
+            lines.append(f"{period.upper()}: {regions}")
+    write_lines(lines)
 
 
 def test_cli_overrides():
@@ -140,7 +157,7 @@ def test_validation():
     """Test configuration validation"""
     print_section("9. Configuration Validation")
     
-    config = create_config_manager()
+    config = _get_cfg()
     
     if config.validate_configuration():
         print("✓ Configuration validation PASSED")
@@ -152,7 +169,7 @@ def test_feature_flags():
     """Test feature flags"""
     print_section("10. Feature Flags")
     
-    config = create_config_manager()
+    config = _get_cfg()
     flags = config.get_feature_flags()
     
     for flag_name, flag_value in flags.items():
@@ -164,36 +181,39 @@ def test_quality_config():
     """Test quality assurance configuration"""
     print_section("11. Quality Assurance Configuration")
     
-    config = create_config_manager()
+    config = _get_cfg()
     qa_config = config.get_quality_config()
     
-    print("Quality validation rules:")
+    lines = ["Quality validation rules:"]
     for rule in qa_config.get('validation_rules', []):
-        print(f"  ✓ {rule}")
+        lines.append(f"  ✓ {rule}")
     
-    print("\nQuality thresholds:")
+    lines.append("\nQuality thresholds:")
     thresholds = qa_config.get('thresholds', {})
     for threshold, value in thresholds.items():
-        print(f"  {threshold}: {value}")
+        lines.append(f"  {threshold}: {value}")
+    write_lines(lines)
 
 
 def test_preservation_config():
     """Test preservation configuration"""
     print_section("12. Preservation Configuration")
     
-    config = create_config_manager()
+    config = _get_cfg()
     pres_config = config.get_preservation_config()
     
-    print("Backup strategy:")
     backup = pres_config.get('backup', {})
-    print(f"  Strategy: {backup.get('strategy')}")
-    print(f"  Frequency: {backup.get('frequency')}")
-    print(f"  Compression: {backup.get('compression')}")
-    
-    print("\nRetention policies:")
+    lines = [
+        "Backup strategy:",
+        f"  Strategy: {backup.get('strategy')}",
+        f"  Frequency: {backup.get('frequency')}",
+        f"  Compression: {backup.get('compression')}",
+        "\nRetention policies:",
+    ]
     retention = pres_config.get('retention_policies', {})
     for policy_name, duration in retention.items():
-        print(f"  {policy_name}: {duration}")
+        lines.append(f"  {policy_name}: {duration}")
+    write_lines(lines)
 
 
 def main():
@@ -118,8 +118,9 @@ def test_uuid_generation():
         assert uuid_str.startswith("urn:uuid:"), f"UUID should start with 'urn:uuid:': {uuid_str}"
         assert len(uuid_str) == 45, f"UUID should be 45 characters: {len(uuid_str)}"
     
-    # Verify uniqueness
-    assert len(set(uuids)) == len(uuids), "All UUIDs should be unique"
+    # Verify uniqueness, over a larger batch than the ones printed
+    batch = [system.generate_uuidv7() for _ in range(10000)]
+    assert len(set(uuids + batch)) == len(uuids) + len(batch), "All UUIDs should be unique"
     
     print("✅ UUID generation tests passed!\n")
 
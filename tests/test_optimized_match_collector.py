@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Test the match collector's on-disk match cache and ordered concurrent fetching.
+"""
+
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.optimized_match_collector import PersistentMatchCache, TFTMatchCollector
+
+
+def test_persistent_match_cache():
+    """Test get/set by (region, match_id) and persistence across reopening."""
+    match = {"metadata": {"match_id": "NA1_1"}, "info": {"participants": [{"placement": 1}]}}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "nested" / "matches.sqlite"
+        cache = PersistentMatchCache(path)
+        assert cache.get("americas", "NA1_1") is None
+        cache.set("americas", "NA1_1", match)
+        assert cache.get("americas", "NA1_1") == match
+        assert cache.get("europe", "NA1_1") is None, "Regions are cached separately"
+
+        cache.set("americas", "NA1_1", {"replaced": True})
+        assert len(cache) == 1
+        cache.close()
+
+        reopened = PersistentMatchCache(path)
+        assert reopened.get("americas", "NA1_1") == {"replaced": True}
+        reopened.close()
+    print("   ✅ Persistent match cache")
+
+
+def test_persistent_match_cache_threads():
+    """Test concurrent writes from fetch threads."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = PersistentMatchCache(Path(tmp) / "matches.sqlite")
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda i: cache.set("americas", f"NA1_{i}", {"i": i}), range(200)))
+        assert len(cache) == 200
+        assert cache.get("americas", "NA1_123") == {"i": 123}
+        cache.close()
+    print("   ✅ Concurrent writes")
+
+
+def test_fetch_in_order_early_exit():
+    """Test ordered results and that closing the generator early cancels queued fetches."""
+    calls = []
+
+    def fetch(key):
+        calls.append(key)
+        time.sleep(0.01)
+        if key == 3:
+            raise ValueError("boom")
+        return key * 10
+
+    collector = TFTMatchCollector.__new__(TFTMatchCollector)
+    results = list(collector._fetch_in_order(fetch, range(6), max_workers=3))
+    assert [(k, r) for k, r, _ in results] == [(0, 0), (1, 10), (2, 20), (3, None), (4, 40), (5, 50)]
+    assert isinstance(results[3][2], ValueError)
+
+    calls.clear()
+    fetched = collector._fetch_in_order(fetch, range(1000), max_workers=2)
+    assert next(fetched)[0] == 0
+    fetched.close()
+    assert len(calls) < 20, "Queued fetches should be cancelled on early exit"
+    print("   ✅ _fetch_in_order")
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Test the pipeline validator's memoized component checks.
+"""
+
+from tests.pipeline_validator import (
+    PipelineReport,
+    PipelineValidator,
+    clear_validation_cache,
+    validate_collection_pipeline,
+    validate_output_formats,
+)
+
+
+def test_malformed_data_reports_error():
+    """Test that data the cache cannot key still gets an error entry, not an exception."""
+    for data in ([1, 2], {1: "int key", "a": "str key"}, None):
+        result = validate_output_formats(data)
+        assert result["formats_valid"] is False, f"{data!r} should not be valid"
+    print("   ✅ Malformed data")
+
+
+def test_component_cache_per_instance():
+    """Test that repeat checks of the same data object are served from the cache."""
+    validator = PipelineValidator()
+    data = {"collectionInfo": {}, "players": {}, "matches": {}}
+
+    first = validator._validate_output_formats(data)
+    assert validator._validate_output_formats(data) is first
+
+    data["@context"] = {}
+    assert validator._validate_output_formats(data) is not first, "New top-level key should miss"
+    print("   ✅ Per-instance cache")
+
+
+def test_convenience_functions_see_in_place_changes():
+    """Test that convenience calls revalidate unless caching is requested."""
+    data = {"collectionInfo": {"timestamp": "2025-01-01T00:00:00"}, "players": {}, "matches": {}}
+    first = validate_collection_pipeline(data)
+    data["collectionInfo"].clear()
+    second = validate_collection_pipeline(data)
+    assert second is not first
+    assert second != first, "Cleared collectionInfo should change the result"
+
+    cached = validate_collection_pipeline(data, cache=True)
+    assert validate_collection_pipeline(data, cache=True) is cached
+    clear_validation_cache()
+    assert validate_collection_pipeline(data, cache=True) is not cached
+    print("   ✅ Convenience functions")
+
+
+def test_pipeline_report_record():
+    """Test that as_dict=False returns a PipelineReport matching the dict form."""
+    validator = PipelineValidator()
+    data = {"collectionInfo": {}, "players": {}, "matches": {}}
+    report = validator.validate_complete_pipeline(data, as_dict=False)
+    assert isinstance(report, PipelineReport)
+    as_dict = report.to_dict()
+    assert set(as_dict) == {"timestamp", "overall_validation_status", "component_validations",
+                            "pipeline_health_score", "critical_issues", "recommendations"}
+    assert as_dict["overall_validation_status"] == report.overall_validation_status
+    print("   ✅ PipelineReport record")
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Test the rate limiter's pacing across threads.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.rate_limiting import RateLimitConfig, RateLimiter
+
+
+def make_limiter(per_second: int) -> RateLimiter:
+    return RateLimiter(RateLimitConfig(max_requests_per_second=per_second, max_requests_per_2_minutes=1000,
+                                       min_sleep_time=0.0, buffer_time=0.05))
+
+
+def test_waiting_caller_does_not_hold_the_lock():
+    """Test that a caller sleeping for a slot leaves the limiter usable."""
+    limiter = make_limiter(per_second=1)
+    limiter.check_and_wait()
+
+    waiter = threading.Thread(target=limiter.check_and_wait)
+    waiter.start()
+    time.sleep(0.1)
+    assert waiter.is_alive(), "Second request should be waiting for the 1s window"
+
+    started = time.monotonic()
+    limiter.record_429_error()
+    assert time.monotonic() - started < 0.5, "Lock should be free while the waiter sleeps"
+
+    waiter.join(timeout=5)
+    assert not waiter.is_alive()
+    assert limiter.stats.total_requests == 2
+    print("   ✅ Sleeping outside the lock")
+
+
+def test_threads_respect_the_window():
+    """Test that concurrent callers never exceed the per-second limit."""
+    limiter = make_limiter(per_second=3)
+    threads = [threading.Thread(target=limiter.check_and_wait) for _ in range(7)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    times = list(limiter.request_times)
+    assert len(times) == 7
+    for i in range(len(times) - 3):
+        assert times[i + 3] - times[i] >= 1.0, "More than 3 requests within one second"
+    print("   ✅ Per-second window across threads")
+
+
+def test_get_stats_while_requests_are_recorded():
+    """Test that get_stats can be polled while worker threads record requests."""
+    limiter = make_limiter(per_second=1000)
+    errors = []
+
+    def poll():
+        try:
+            for _ in range(200):
+                limiter.get_stats()
+        except RuntimeError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=lambda: [limiter.check_and_wait() for _ in range(100)]) for _ in range(4)]
+    threads.append(threading.Thread(target=poll))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert not errors, errors
+    assert limiter.get_stats()["recent_requests_2m"] == 400
+    print("   ✅ get_stats under concurrent requests")
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Test the fused research aggregation on irregular match data.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.research_analysis import aggregate_matches
+
+
+def make_match(participants, version="Version 15.22.1"):
+    return {"info": {"game_version": version, "participants": participants}}
+
+
+def test_placement_histograms():
+    """Test placement/level histograms with oversized lobbies and null or missing values."""
+    big_lobby = [{"placement": i % 8 + 1, "level": 9} for i in range(10)]
+    nulls = [{"placement": 3, "level": None}, {"level": 7}]
+    agg = aggregate_matches([make_match(big_lobby), make_match(nulls), {"info": {}}])
+
+    assert agg["participant_count"] == 12
+    assert agg["placement_counts"] == {1: 2, 2: 2, 3: 2, 4: 1, 5: 1, 6: 1, 7: 1, 8: 1}
+    assert agg["level_counts"] == {9: 10, 7: 1}
+    print("   ✅ Placement and level histograms")
+
+
+def test_malformed_entries_are_skipped():
+    """Test that null placements and non-item entries don't abort aggregation."""
+    participants = [
+        {"placement": None, "units": [{"character_id": "TFT13_Jinx", "itemNames": ["TFT_Item_A"]}]},
+        {"placement": 2,
+         "units": [{"character_id": "TFT13_Vi", "itemNames": ["TFT_Item_A", None, {"id": 1}]},
+                   {"character_id": "TFT13_Ekko", "items": [44, None]}],
+         "augments": ["TFT13_Augment_X", None]},
+    ]
+    agg = aggregate_matches([make_match(participants)])
+
+    assert set(agg["unit_placements"]) == {"Vi", "Ekko"}
+    assert {k: list(v) for k, v in agg["item_placements"].items()} == {"A": [2], "Item_44": [2]}
+    assert {k: list(v) for k, v in agg["augment_placements"].items()} == {"X": [2]}
+    print("   ✅ Malformed entries skipped")
+
+
+def test_out_of_range_values_are_skipped():
+    """Test that placements/levels too large for the byte arrays don't abort aggregation."""
+    participants = [
+        {"placement": 1000, "level": 300, "units": [{"character_id": "TFT13_Jinx"}]},
+        {"placement": 2, "level": 8, "units": [{"character_id": "TFT13_Vi"}]},
+    ]
+    agg = aggregate_matches([make_match(participants)])
+
+    assert agg["participant_count"] == 2
+    assert agg["placement_counts"] == {2: 1}
+    assert agg["level_counts"] == {8: 1}
+    assert {k: list(v) for k, v in agg["unit_placements"].items()} == {"Vi": [2]}
+    print("   ✅ Out-of-range values skipped")
+
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Test that re-running a match retry with the same output resumes it
+instead of duplicating recovered matches.
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.retry_failed_matches import MatchRetryCollector, load_recovered_match_ids
+
+
+def make_collector(calls):
+    """Collector with the API and identifier registry replaced by in-memory fakes"""
+    collector = MatchRetryCollector.__new__(MatchRetryCollector)
+    collector.requester = SimpleNamespace(config=SimpleNamespace(max_requests_per_second=2))
+    collector.identifier_system = SimpleNamespace(create_match_identifier=lambda match_id, _: f"urn:{match_id}")
+
+    def get_match_details(match_id):
+        calls.append(match_id)
+        return None if match_id == "NA1_3" else {"info": {"id": match_id}}
+
+    collector.get_match_details = get_match_details
+    return collector
+
+
+def test_rerun_skips_recovered_matches():
+    """Test that matches already in the .jsonl file are neither fetched nor written again."""
+    calls = []
+    collector = make_collector(calls)
+    with tempfile.TemporaryDirectory() as tmp:
+        matches_file = Path(tmp) / "retry.jsonl"
+        collector.retry_match_ids(["NA1_1", "NA1_2", "NA1_3"], matches_file=str(matches_file))
+        # Simulate a crash mid-write
+        with open(matches_file, "a") as f:
+            f.write('{"match_id": "NA1_4", "da')
+
+        calls.clear()
+        results = collector.retry_match_ids(["NA1_1", "NA1_2", "NA1_3", "NA1_4"], matches_file=str(matches_file))
+        assert sorted(calls) == ["NA1_3", "NA1_4"]
+        assert results["retry_stats"]["successful_match_ids"] == ["NA1_4"]
+
+        ids = [json.loads(line)["match_id"] for line in matches_file.read_text().splitlines()[:2]]
+        assert sorted(ids) == ["NA1_1", "NA1_2"]
+        assert load_recovered_match_ids(str(matches_file)) == {"NA1_1", "NA1_2", "NA1_4"}
+        assert load_recovered_match_ids(str(Path(tmp) / "missing.jsonl")) == set()
+    print("   ✅ Re-run resumes recovered matches")
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test the Riot API response cache: expiry, stale fallback and copy-on-read.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.riot_api_endpoints import ResponseCache, RiotAPIEndpoints
+
+
+class ScriptedEndpoints(RiotAPIEndpoints):
+    """Endpoints whose _make_request answers from a list of canned responses"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def _make_request(self, url, params=None, timeout=None):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+def test_response_cache_ttl():
+    """Test that entries are fresh until their TTL and kept after it."""
+    cache = ResponseCache()
+    assert cache.get("missing") == (None, False)
+
+    cache.put("fresh", {"a": 1}, ttl=60)
+    cache.put("stale", {"b": 2}, ttl=0)
+    assert cache.get("fresh") == ({"a": 1}, True)
+    assert cache.get("stale") == ({"b": 2}, False)
+
+    small = ResponseCache(maxsize=2)
+    for key in ("x", "y", "z"):
+        small.put(key, key, ttl=60)
+    assert small.get("x") == (None, False), "Oldest entry should be evicted"
+    print("   ✅ TTL and eviction")
+
+
+def test_response_cache_returns_copies():
+    """Test that mutating a stored or returned body does not change the cache."""
+    cache = ResponseCache()
+    body = {"metadata": {"match_id": "NA1_1"}}
+    cache.put("k", body, ttl=60)
+    body["@id"] = "changed after put"
+
+    first, _ = cache.get("k")
+    first["metadata"]["riot_match_id"] = "annotated by caller"
+    second, _ = cache.get("k")
+
+    assert second == {"metadata": {"match_id": "NA1_1"}}
+    assert first is not second
+    print("   ✅ Copies on read")
+
+
+def test_cached_request_stale_fallback():
+    """Test fresh hits skip the API and failed requests fall back to stale data."""
+    api = ScriptedEndpoints([{"v": 1}, None, None])
+    url = "https://example.invalid/tft"
+
+    assert api._cached_request(url, {"q": 1}, policy="long") == {"v": 1}
+    assert api._cached_request(url, {"q": 1}, policy="long") == {"v": 1}
+    assert api.calls == 1, "Fresh hit should not call the API"
+
+    # Age the entry past its TTL, then let the upstream request fail
+    key = (url, (("q", 1),))
+    api.response_cache._entries[key] = (0.0, api.response_cache._entries[key][1])
+    assert api._cached_request(url, {"q": 1}, policy="long") == {"v": 1}
+    assert api.calls == 2
+
+    assert api._cached_request(url, {"q": 2}, policy="long") is None
+    print("   ✅ Stale fallback")
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test the JSON-LD transformation: document and NDJSON output, directory
+batches, and that a failed transform leaves the previous output in place.
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.transform_to_jsonld import transform_to_jsonld, transform_directory
+
+
+def make_collection(match_count: int = 2) -> dict:
+    """Build a small validated collection"""
+    return {
+        "collectionInfo": {"timestamp": "2025-01-01T00:00:00", "extractionLocation": "na1"},
+        "players": {"P1": {"tier": "CHALLENGER"}},
+        "matches": {
+            f"NA1_{i}": {"info": {"participants": [{"puuid": "P1", "placement": 1}]}}
+            for i in range(match_count)
+        },
+    }
+
+
+def write_collection(path: Path, data: dict) -> Path:
+    path.write_text(json.dumps(data))
+    return path
+
+
+def test_transform_document():
+    """Test that the single-document output is annotated JSON-LD."""
+    with tempfile.TemporaryDirectory() as tmp:
+        src = write_collection(Path(tmp) / "collection.json", make_collection())
+        dst = Path(tmp) / "out" / "collection.jsonld"
+        transform_to_jsonld(src, dst)
+
+        doc = json.loads(dst.read_text())
+        assert doc["@type"] == "TFTDataCollection"
+        assert doc["collectionInfo"]["@id"] == "urn:tft:collection:na1:2025-01-01T00:00:00"
+        assert doc["players"]["P1"]["@id"] == "urn:tft:player:P1"
+        participant = doc["matches"]["NA1_0"]["info"]["participants"][0]
+        assert participant["@id"] == "urn:tft:participant:NA1_0:P1"
+        assert list(Path(tmp, "out").iterdir()) == [dst], "No temp files should be left behind"
+    print("   ✅ JSON-LD document")
+
+
+def test_transform_ndjson():
+    """Test that NDJSON output has a header line, then one line per record."""
+    with tempfile.TemporaryDirectory() as tmp:
+        src = write_collection(Path(tmp) / "collection.json", make_collection(3))
+        dst = Path(tmp) / "collection.ndjson"
+        transform_to_jsonld(src, dst, ndjson=True)
+
+        lines = [json.loads(line) for line in dst.read_text().splitlines()]
+        assert "@context" in lines[0] and lines[0]["@type"] == "TFTDataCollection"
+        assert [line["@type"] for line in lines[1:]] == ["TFTPlayer"] + ["TFTMatch"] * 3
+    print("   ✅ NDJSON")
+
+
+def test_failed_transform_keeps_previous_output():
+    """Test that a record failing mid-stream does not replace the output file."""
+    with tempfile.TemporaryDirectory() as tmp:
+        dst = Path(tmp) / "collection.jsonld"
+        dst.write_text('{"previous": true}')
+
+        broken = make_collection()
+        broken["matches"]["NA1_1"] = ["not", "a", "match"]
+        src = write_collection(Path(tmp) / "collection.json", broken)
+        try:
+            transform_to_jsonld(src, dst)
+        except TypeError:
+            pass
+        else:
+            raise AssertionError("Transform of a malformed match should fail")
+
+        assert json.loads(dst.read_text()) == {"previous": True}
+        assert sorted(p.name for p in Path(tmp).iterdir()) == ["collection.json", "collection.jsonld"]
+    print("   ✅ Failed transform leaves output untouched")
+
+
+def test_transform_directory():
+    """Test batch transformation, including reporting of failed inputs."""
+    with tempfile.TemporaryDirectory() as tmp:
+        input_dir = Path(tmp) / "in"
+        input_dir.mkdir()
+        write_collection(input_dir / "a.json", make_collection())
+        write_collection(input_dir / "b.json", make_collection())
+        (input_dir / "bad.json").write_text("{not json")
+
+        written, failed = transform_directory(input_dir, Path(tmp) / "out", max_workers=2, ndjson=True)
+        assert [p.name for p in written] == ["a.ndjson", "b.ndjson"]
+        assert [p.name for p in failed] == ["bad.json"]
+        assert all(p.exists() for p in written)
+    print("   ✅ Directory transform")
+
+
+def test_cli_input_dir_ndjson():
+    """Test the --input-dir/--output-dir/--ndjson command line."""
+    script = Path(__file__).parent.parent / "scripts" / "transform_to_jsonld.py"
+    with tempfile.TemporaryDirectory() as tmp:
+        input_dir = Path(tmp) / "in"
+        input_dir.mkdir()
+        write_collection(input_dir / "a.json", make_collection())
+
+        result = subprocess.run(
+            [sys.executable, str(script), "--input-dir", str(input_dir),
+             "--output-dir", str(Path(tmp) / "out"), "--workers", "1", "--ndjson"],
+            capture_output=True, text=True, timeout=60
+        )
+        assert result.returncode == 0, result.stderr
+        lines = (Path(tmp) / "out" / "a.ndjson").read_text().splitlines()
+        assert len(lines) == 1 + 1 + 2
+
+        # --input-dir without --output-dir is a usage error
+        result = subprocess.run([sys.executable, str(script), "--input-dir", str(input_dir)],
+                                capture_output=True, text=True, timeout=60)
+        assert result.returncode == 2
+    print("   ✅ --input-dir --ndjson CLI")
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Test the shared data utilities: saving/loading collections and
+incomplete-match detection.
+"""
+
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts import utils
+from scripts.utils import (
+    MATCH_INDEX_DTYPE,
+    build_match_index,
+    identify_incomplete_matches,
+    identify_incomplete_matches_many,
+    identify_incomplete_matches_vec,
+    load_data_from_file,
+    load_match_index,
+    load_match_summaries,
+    save_data_stream,
+    save_data_to_file,
+)
+
+
+def make_collection(offset: int = 0) -> dict:
+    """Collection with one complete and two incomplete matches"""
+    return {
+        "collectionInfo": {"timestamp": "2025-01-01T00:00:00"},
+        "players": {"P1": {"matches": {}}},
+        "matches": {
+            f"NA1_{offset + 1}": {"info": {"queueId": 1100, "gameVersion": "v", "participants": [{}] * 8}},
+            f"NA1_{offset + 2}": {"info": {"queueId": 1100, "gameVersion": "v", "participants": [{}] * 5}},
+            f"NA1_{offset + 3}": {"info": {"queueId": 1220, "participants": [{}] * 8}},
+        },
+    }
+
+
+def test_identify_incomplete_matches_many():
+    """Test that the process-pool variant matches the serial one, in input order."""
+    with tempfile.TemporaryDirectory() as tmp:
+        sources = []
+        for i in range(5):
+            data = make_collection(offset=10 * i)
+            # Mix on-disk paths with in-memory dicts
+            sources.append(save_data_to_file(data, Path(tmp) / f"c{i}.json") if i % 2 else data)
+
+        expected = [identify_incomplete_matches(make_collection(offset=10 * i)) for i in range(5)]
+        assert identify_incomplete_matches_many(sources, max_workers=2) == expected
+        assert identify_incomplete_matches_many(sources[:1]) == expected[:1]
+    print("   ✅ identify_incomplete_matches_many")
+
+
+def test_save_recreates_removed_directory():
+    """Test that a directory removed after a save is recreated by the next one."""
+    data = make_collection()
+    with tempfile.TemporaryDirectory() as tmp:
+        out_dir = Path(tmp) / "out"
+        for save in (save_data_to_file, save_data_stream):
+            assert save(data, out_dir / "first.json")
+            shutil.rmtree(out_dir)
+            assert save(data, out_dir / "second.json"), f"{save.__name__} after rmtree"
+            assert load_data_from_file(out_dir / "second.json") == data
+            shutil.rmtree(out_dir)
+    print("   ✅ Removed directory recreated")
+
+
+def test_identify_incomplete_matches_vec_parity():
+    """Test that the columnar variant flags the same matches as the dict walk."""
+    data = make_collection()
+    data["matches"].update({
+        "NA1_4": {"info": {"queueId": 1220, "gameVersion": "v", "participants": [{}] * 3}},
+        "NA1_5": {"info": {"gameVersion": "v", "participants": []}},
+        "NA1_6": {"metadata": {}},
+    })
+    index = build_match_index(data)
+
+    vec = identify_incomplete_matches_vec(index["match_id"], index["queue_id"],
+                                          index["count"], index["game_version"])
+    assert vec == identify_incomplete_matches(data)
+    assert [m["match_id"] for m in vec] == ["NA1_2", "NA1_3", "NA1_4", "NA1_5"]
+    print("   ✅ Columnar parity")
+
+
+def test_load_match_summaries_and_index(monkeypatch):
+    """Test streamed match summaries and the index built from them, with and without ijson."""
+    data = make_collection()
+    data["matches"]["NA1_9"] = {"metadata": {}}
+    expected = [("NA1_1", 1100, 8, "v"), ("NA1_2", 1100, 5, "v"), ("NA1_3", 1220, 8, None)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = save_data_to_file(data, Path(tmp) / "collection.json")
+        for streaming in (True, False):
+            if not streaming:
+                monkeypatch.setattr(utils, "ijson", None)
+            assert list(load_match_summaries(path)) == expected
+
+            index = load_match_index(path)
+            assert index.dtype == np.dtype(MATCH_INDEX_DTYPE)
+            assert index.tolist() == build_match_index(data).tolist()
+    print("   ✅ Match summaries and index")
+
+
+def test_zst_round_trip():
+    """Test that .json.zst saves are compressed and load back unchanged."""
+    data = make_collection()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = save_data_to_file(data, Path(tmp) / "collection.json.zst")
+        assert Path(path).read_bytes()[:4] == b"\x28\xb5\x2f\xfd", "Expected a zstd frame"
+        assert load_data_from_file(path) == data
+
+        summaries = list(load_match_summaries(path))
+        assert [s[0] for s in summaries] == list(data["matches"])
+    print("   ✅ .json.zst round-trip")
+
+
+def test_save_data_stream_round_trip():
+    """Test that streamed saves load back and match save_data_to_file byte for byte."""
+    data = make_collection()
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ("collection.json", "collection.json.zst"):
+            path, size = save_data_stream(data, Path(tmp) / "streamed" / name)
+            assert size == Path(path).stat().st_size
+            assert load_data_from_file(path) == data
+
+        whole = save_data_to_file(data, Path(tmp) / "whole.json")
+        assert Path(whole).read_bytes() == (Path(tmp) / "streamed" / "collection.json").read_bytes()
+        assert sorted(p.name for p in (Path(tmp) / "streamed").iterdir()) == ["collection.json", "collection.json.zst"]
+    print("   ✅ save_data_stream round-trip")
+
+
+def test_incomplete_match_records():
+    """Test that as_dict=False returns slotted records matching the dict form."""
+    data = make_collection()
+    records = identify_incomplete_matches(data, as_dict=False)
+    assert [r.to_dict() for r in records] == identify_incomplete_matches(data)
+    assert not hasattr(records[0], "__dict__")
+    print("   ✅ IncompleteMatch records")
+
+
+def test_concurrent_saves_to_one_path():
+    """Test that threads saving the same file don't clobber each other's temp file."""
+    collections = [make_collection(offset=10 * i) for i in range(8)]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "collection.json"
+        for save in (save_data_to_file, save_data_stream):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                saved = list(executor.map(lambda data: save(data, path), collections * 4))
+            assert all(saved), f"{save.__name__} failed under concurrency"
+            assert load_data_from_file(path) in collections
+            assert [p.name for p in Path(tmp).iterdir()] == ["collection.json"]
+    print("   ✅ Concurrent saves")
@@ -11,6 +11,24 @@ from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+_pyplot = None
+
+
+def load_pyplot():
+    """
+    Import matplotlib.pyplot on the non-interactive Agg backend, once per process.
+    
+    Agg is selected before pyplot is first imported, so figures can also be
+    rendered from worker threads. Raises ImportError if matplotlib is missing.
+    """
+    global _pyplot
+    if _pyplot is None:
+        import matplotlib
+        matplotlib.use('Agg')  # Non-interactive backend
+        import matplotlib.pyplot as plt
+        _pyplot = plt
+    return _pyplot
+
 
 def create_player_match_visualization(data: Dict[str, Any], output_path: Optional[str] = None) -> Dict[str, Any]:
     """
@@ -33,9 +51,7 @@ def create_player_match_visualization(data: Dict[str, Any], output_path: Optiona
     
     try:
         # Check if matplotlib is available
-        import matplotlib
-        matplotlib.use('Agg')  # Non-interactive backend
-        import matplotlib.pyplot as plt
+        load_pyplot()
         
         result["matplotlib_available"] = True
         
@@ -122,9 +138,8 @@ def validate_chart_generation(chart_type: str = "bar", data: Optional[Dict[str,
         return result
     
     try:
+        load_pyplot()
         import matplotlib
-        matplotlib.use('Agg')
-        import matplotlib.pyplot as plt
         
         result["matplotlib_version"] = matplotlib.__version__
         result["backend"] = matplotlib.get_backend()